@@ -21,8 +21,9 @@ from app.config.logger import get_logger
 from app.db.engine import get_db, init_db
 from app.db.models import Policy, Document, DocTypeEnum
 from app.vector_store import get_qdrant_manager, get_embedder, chunk_text
+from app.services.policy_search_service import POLICY_PAYLOAD_KEY, policy_to_payload
 
-from qdrant_client.models import PointStruct
+from sqlalchemy.orm import joinedload
 
 logger = get_logger()
 settings = get_settings()
@@ -168,7 +169,7 @@ def ingest_to_qdrant() -> int:
         
         # Get all documents from MySQL
         with get_db() as db:
-            documents = db.query(Document).all()
+            documents = db.query(Document).options(joinedload(Document.policy)).all()
             logger.info(f"Found {len(documents)} documents to embed")
             
             if not documents:
@@ -177,7 +178,12 @@ def ingest_to_qdrant() -> int:
             
             # Prepare chunks
             all_chunks = []
+            policy_payloads = {}
             for doc in documents:
+                # Store policy fields in the payload so search can skip MySQL
+                if doc.policy_id not in policy_payloads:
+                    policy_payloads[doc.policy_id] = policy_to_payload(doc.policy)
+                
                 # Chunk document content
                 chunks = chunk_text(
                     text=doc.content,
@@ -188,13 +194,18 @@ def ingest_to_qdrant() -> int:
                     }
                 )
                 
+                # Policies without a valid payload fall back to MySQL at search time
+                policy_payload = policy_payloads[doc.policy_id]
+                extra_metadata = {POLICY_PAYLOAD_KEY: policy_payload} if policy_payload else {}
+                
                 all_chunks.extend([
                     {
                         "content": chunk["content"],
                         "metadata": {
                             **chunk["metadata"],
                             "document_id": doc.id,
-                            "chunk_index": chunk["chunk_index"]
+                            "chunk_index": chunk["chunk_index"],
+                            **extra_metadata
                         }
                     }
                     for chunk in chunks
@@ -219,24 +230,19 @@ def ingest_to_qdrant() -> int:
                     show_progress=True
                 )
                 
-                # Create points
-                points = []
-                for j, (chunk, embedding) in enumerate(zip(batch, embeddings)):
-                    point_id = int(uuid.uuid4().int >> 64)  # Generate unique ID
-                    
-                    point = PointStruct(
-                        id=point_id,
-                        vector=embedding,
-                        payload={
+                # Upsert to Qdrant (embedding matrix is sent as one batch)
+                qdrant_manager.upsert_vectors(
+                    ids=[int(uuid.uuid4().int >> 64) for _ in batch],  # Generate unique IDs
+                    vectors=embeddings,
+                    payloads=[
+                        {
                             "content": chunk["content"],
                             **chunk["metadata"]
                         }
-                    )
-                    points.append(point)
-                
-                # Upsert to Qdrant
-                qdrant_manager.upsert_points(points)
-                total_points += len(points)
+                        for chunk in batch
+                    ]
+                )
+                total_points += len(batch)
                 
                 logger.info(f"Uploaded batch {i // batch_size + 1}/{(len(all_chunks) + batch_size - 1) // batch_size}")
             
@@ -3,14 +3,16 @@ Agent Controller
 LangGraph 워크플로우 진입점
 """
 
-from typing import Dict, Any, List
+from typing import Dict, Any, List, AsyncIterator
+import asyncio
 import uuid
 
 from ..config.logger import get_logger
 from ..db.engine import get_db
 from ..db.repositories import SessionRepository
 from ..db.models import WorkflowTypeEnum, RoleEnum
-from .workflows import run_qa_workflow
+from .workflows import run_qa_workflow, prepare_qa_stream
+from .nodes import stream_answer
 
 logger = get_logger()
 
@@ -40,40 +42,7 @@ class AgentController:
             Dict: 실행 결과
         """
         try:
-            # Get or create session
-            with get_db() as db:
-                session_repo = SessionRepository(db)
-                
-                # Check if session exists
-                session = session_repo.get_by_id(session_id)
-                
-                if not session:
-                    # Create new session
-                    logger.info(
-                        "Creating new Q&A session",
-                        extra={"session_id": session_id, "policy_id": policy_id}
-                    )
-                    session = session_repo.create(
-                        session_id=session_id,
-                        workflow_type=WorkflowTypeEnum.QA,
-                        policy_id=policy_id
-                    )
-                
-                # Get chat history
-                messages = []
-                chat_history = session_repo.get_chat_history(session_id, limit=10)
-                for chat in chat_history:
-                    messages.append({
-                        "role": chat.role.value,
-                        "content": chat.content
-                    })
-                
-                # Add user message to history
-                session_repo.add_chat_message(
-                    session_id=session_id,
-                    role=RoleEnum.USER,
-                    content=user_message
-                )
+            messages = AgentController._prepare_session(session_id, policy_id, user_message)
             
             # Run workflow
             result = run_qa_workflow(
@@ -84,18 +53,7 @@ class AgentController:
             )
             
             # Save assistant response
-            with get_db() as db:
-                session_repo = SessionRepository(db)
-                session_repo.add_chat_message(
-                    session_id=session_id,
-                    role=RoleEnum.ASSISTANT,
-                    content=result.get("answer", ""),
-                    metadata={
-                        "evidence": result.get("evidence", []),
-                        "retrieved_docs_count": len(result.get("retrieved_docs", [])),
-                        "web_sources_count": len(result.get("web_sources", []))
-                    }
-                )
+            AgentController._save_answer(session_id, result.get("answer", ""), result)
             
             return {
                 "session_id": session_id,
@@ -123,6 +81,154 @@ class AgentController:
                 "error": str(e)
             }
     
+    @staticmethod
+    async def stream_qa(
+        session_id: str,
+        policy_id: int,
+        user_message: str
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Q&A 워크플로우 스트리밍 실행
+        
+        검색 단계는 워커 스레드에서 실행하고, 답변은 토큰 단위로 전달합니다.
+        
+        Args:
+            session_id: 세션 ID
+            policy_id: 정책 ID
+            user_message: 사용자 메시지
+        
+        Yields:
+            Dict: 이벤트 ({"type": "token" | "done" | "error", ...})
+        """
+        try:
+            messages = await asyncio.to_thread(
+                AgentController._prepare_session, session_id, policy_id, user_message
+            )
+            
+            state = await asyncio.to_thread(
+                prepare_qa_stream,
+                session_id=session_id,
+                policy_id=policy_id,
+                user_query=user_message,
+                messages=messages
+            )
+            
+            # Stream answer tokens
+            answer_parts = []
+            async for token in stream_answer(state["llm_messages"]):
+                answer_parts.append(token)
+                yield {"type": "token", "content": token}
+            
+            answer = "".join(answer_parts)
+            await asyncio.to_thread(
+                AgentController._save_answer, session_id, answer, state
+            )
+            
+            yield {
+                "type": "done",
+                "session_id": session_id,
+                "policy_id": policy_id,
+                "evidence": state.get("evidence", []),
+                "error": state.get("error")
+            }
+            
+        except Exception as e:
+            logger.error(
+                "Error in Q&A stream controller",
+                extra={
+                    "session_id": session_id,
+                    "policy_id": policy_id,
+                    "error": str(e)
+                },
+                exc_info=True
+            )
+            yield {
+                "type": "error",
+                "session_id": session_id,
+                "policy_id": policy_id,
+                "error": str(e)
+            }
+    
+    @staticmethod
+    def _prepare_session(
+        session_id: str,
+        policy_id: int,
+        user_message: str
+    ) -> List[Dict[str, str]]:
+        """
+        세션 조회/생성 후 대화 이력 반환 및 사용자 메시지 저장
+        
+        Args:
+            session_id: 세션 ID
+            policy_id: 정책 ID
+            user_message: 사용자 메시지
+        
+        Returns:
+            List[Dict]: 이전 대화 이력
+        """
+        with get_db() as db:
+            session_repo = SessionRepository(db)
+            
+            # Check if session exists
+            session = session_repo.get_by_id(session_id)
+            
+            if not session:
+                # Create new session
+                logger.info(
+                    "Creating new Q&A session",
+                    extra={"session_id": session_id, "policy_id": policy_id}
+                )
+                session = session_repo.create(
+                    session_id=session_id,
+                    workflow_type=WorkflowTypeEnum.QA,
+                    policy_id=policy_id
+                )
+            
+            # Get chat history
+            messages = []
+            chat_history = session_repo.get_chat_history(session_id, limit=10)
+            for chat in chat_history:
+                messages.append({
+                    "role": chat.role.value,
+                    "content": chat.content
+                })
+            
+            # Add user message to history
+            session_repo.add_chat_message(
+                session_id=session_id,
+                role=RoleEnum.USER,
+                content=user_message
+            )
+        
+        return messages
+    
+    @staticmethod
+    def _save_answer(
+        session_id: str,
+        answer: str,
+        result: Dict[str, Any]
+    ) -> None:
+        """
+        어시스턴트 답변을 대화 이력에 저장
+        
+        Args:
+            session_id: 세션 ID
+            answer: 생성된 답변
+            result: 워크플로우 결과 (evidence, retrieved_docs, web_sources)
+        """
+        with get_db() as db:
+            session_repo = SessionRepository(db)
+            session_repo.add_chat_message(
+                session_id=session_id,
+                role=RoleEnum.ASSISTANT,
+                content=answer,
+                metadata={
+                    "evidence": result.get("evidence", []),
+                    "retrieved_docs_count": len(result.get("retrieved_docs", [])),
+                    "web_sources_count": len(result.get("web_sources", []))
+                }
+            )
+    
     @staticmethod
     def reset_session(session_id: str) -> bool:
         """
@@ -4,7 +4,7 @@ from .classify_node import classify_query_node
 from .retrieve_node import retrieve_from_db_node
 from .check_node import check_sufficiency_node
 from .web_search_node import web_search_node
-from .answer_node import generate_answer_node
+from .answer_node import generate_answer_node, build_answer_context, stream_answer
 
 __all__ = [
     "classify_query_node",
@@ -12,5 +12,7 @@ __all__ = [
     "check_sufficiency_node",
     "web_search_node",
     "generate_answer_node",
+    "build_answer_context",
+    "stream_answer",
 ]
 
@@ -3,7 +3,7 @@ Answer Generation Node
 LLM으로 최종 답변 생성
 """
 
-from typing import Dict, Any
+from typing import Dict, Any, AsyncIterator, List, Tuple
 from jinja2 import Template
 from pathlib import Path
 
@@ -16,6 +16,84 @@ from ...db.models import Policy
 logger = get_logger()
 
 
+def build_answer_context(state: Dict[str, Any]) -> Tuple[List[Dict[str, str]], List[Dict[str, Any]]]:
+    """
+    답변 생성용 LLM 메시지와 근거 목록 구성
+    
+    정책 정보 + 검색된 문서 + 웹 소스를 프롬프트로 렌더링
+    
+    Args:
+        state: 현재 상태
+    
+    Returns:
+        Tuple: (LLM 메시지 리스트, 근거 목록)
+    """
+    current_query = state.get("current_query", "")
+    policy_id = state.get("policy_id")
+    retrieved_docs = state.get("retrieved_docs", [])
+    web_sources = state.get("web_sources", [])
+    
+    # Get policy information
+    policy_info = {}
+    if policy_id:
+        with get_db() as db:
+            policy = db.query(Policy).filter(Policy.id == policy_id).first()
+            if policy:
+                policy_info = {
+                    "policy_name": policy.program_name,
+                    "policy_overview": policy.program_overview or "",
+                    "apply_target": policy.apply_target or "",
+                    "support_description": policy.support_description or ""
+                }
+    
+    # Load prompt template
+    prompt_path = Path(__file__).parent.parent.parent / "prompts" / "policy_qa_prompt.jinja2"
+    with open(prompt_path, 'r', encoding='utf-8') as f:
+        template_str = f.read()
+    
+    template = Template(template_str)
+    
+    # Render prompt
+    prompt = template.render(
+        policy_name=policy_info.get("policy_name", ""),
+        policy_overview=policy_info.get("policy_overview", ""),
+        apply_target=policy_info.get("apply_target", ""),
+        support_description=policy_info.get("support_description", ""),
+        retrieved_docs=retrieved_docs,
+        web_sources=web_sources,
+        user_question=current_query
+    )
+    
+    messages = [
+        {"role": "system", "content": "당신은 정부 정책 전문 상담사입니다."},
+        {"role": "user", "content": prompt}
+    ]
+    
+    # Build evidence
+    evidence = []
+    
+    # Add internal docs as evidence
+    for i, doc in enumerate(retrieved_docs, 1):
+        evidence.append({
+            "type": "internal",
+            "source": f"정책 문서 (섹션: {doc.get('doc_type', 'unknown')})",
+            "content": doc.get("content", "")[:200] + "...",
+            "score": doc.get("score", 0.0)
+        })
+    
+    # Add web sources as evidence
+    for i, source in enumerate(web_sources, 1):
+        evidence.append({
+            "type": "web",
+            "source": source.get("title", ""),
+            "content": source.get("snippet", "")[:200] + "...",
+            "url": source.get("url", ""),
+            "fetched_date": source.get("fetched_date", "")
+        })
+    
+    return messages, evidence
+
+
 @trace_llm_call(name="generate_answer", tags=["node", "llm", "answer"])
 def generate_answer_node(state: Dict[str, Any]) -> Dict[str, Any]:
     """
@@ -30,72 +108,11 @@ def generate_answer_node(state: Dict[str, Any]) -> Dict[str, Any]:
         Dict: 업데이트된 상태 (answer, evidence 추가)
     """
     try:
-        current_query = state.get("current_query", "")
-        policy_id = state.get("policy_id")
-        retrieved_docs = state.get("retrieved_docs", [])
-        web_sources = state.get("web_sources", [])
-        
-        # Get policy information
-        policy_info = {}
-        if policy_id:
-            with get_db() as db:
-                policy = db.query(Policy).filter(Policy.id == policy_id).first()
-                if policy:
-                    policy_info = {
-                        "policy_name": policy.program_name,
-                        "policy_overview": policy.program_overview or "",
-                        "apply_target": policy.apply_target or "",
-                        "support_description": policy.support_description or ""
-                    }
-        
-        # Load prompt template
-        prompt_path = Path(__file__).parent.parent.parent / "prompts" / "policy_qa_prompt.jinja2"
-        with open(prompt_path, 'r', encoding='utf-8') as f:
-            template_str = f.read()
-        
-        template = Template(template_str)
-        
-        # Render prompt
-        prompt = template.render(
-            policy_name=policy_info.get("policy_name", ""),
-            policy_overview=policy_info.get("policy_overview", ""),
-            apply_target=policy_info.get("apply_target", ""),
-            support_description=policy_info.get("support_description", ""),
-            retrieved_docs=retrieved_docs,
-            web_sources=web_sources,
-            user_question=current_query
-        )
+        messages, evidence = build_answer_context(state)
         
         # Generate answer
         llm_client = get_openai_client()
-        answer = llm_client.generate(
-            messages=[
-                {"role": "system", "content": "당신은 정부 정책 전문 상담사입니다."},
-                {"role": "user", "content": prompt}
-            ]
-        )
-        
-        # Build evidence
-        evidence = []
-        
-        # Add internal docs as evidence
-        for i, doc in enumerate(retrieved_docs, 1):
-            evidence.append({
-                "type": "internal",
-                "source": f"정책 문서 (섹션: {doc.get('doc_type', 'unknown')})",
-                "content": doc.get("content", "")[:200] + "...",
-                "score": doc.get("score", 0.0)
-            })
-        
-        # Add web sources as evidence
-        for i, source in enumerate(web_sources, 1):
-            evidence.append({
-                "type": "web",
-                "source": source.get("title", ""),
-                "content": source.get("snippet", "")[:200] + "...",
-                "url": source.get("url", ""),
-                "fetched_date": source.get("fetched_date", "")
-            })
+        answer = llm_client.generate(messages=messages)
         
         logger.info(
             "Answer generated",
@@ -124,3 +141,18 @@ def generate_answer_node(state: Dict[str, Any]) -> Dict[str, Any]:
             "error": str(e)
         }
 
+
+@trace_llm_call(name="generate_answer", tags=["node", "llm", "answer", "stream"])
+async def stream_answer(llm_messages: List[Dict[str, str]]) -> AsyncIterator[str]:
+    """
+    LLM 답변을 토큰 단위로 스트리밍 (generate_answer_node의 스트리밍 버전)
+    
+    Args:
+        llm_messages: build_answer_context로 구성한 LLM 메시지
+    
+    Yields:
+        str: 생성된 답변 조각
+    """
+    llm_client = get_openai_client()
+    async for token in llm_client.stream(llm_messages):
+        yield token
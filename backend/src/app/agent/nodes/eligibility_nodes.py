@@ -13,6 +13,7 @@ from ...observability import trace_workflow, trace_llm_call
 from ...llm import get_openai_client
 from ...db.engine import get_db
 from ...db.models import Policy
+from ...domain.eligibility import ConditionQuestion
 
 logger = get_logger()
 
@@ -226,6 +227,25 @@ def generate_question_node(state: Dict[str, Any]) -> Dict[str, Any]:
                 "current_condition_index": len(conditions)
             }
         
+        # Use question pre-generated by the batch call if its slots are unchanged
+        question_cache = state.get("question_cache") or {}
+        cached_question = question_cache.get(
+            _question_cache_key(next_index, next_condition, user_slots)
+        )
+        if cached_question:
+            logger.info(
+                "Using pre-generated question",
+                extra={
+                    "condition_index": next_index,
+                    "condition_name": next_condition.get("name")
+                }
+            )
+            return {
+                **state,
+                "current_question": cached_question,
+                "current_condition_index": next_index
+            }
+        
         # Get policy info
         policy_name = ""
         if policy_id:
@@ -234,6 +254,35 @@ def generate_question_node(state: Dict[str, Any]) -> Dict[str, Any]:
                 if policy:
                     policy_name = policy.program_name
         
+        # Generate questions for all UNKNOWN conditions in a single LLM call
+        unknown_indices = [
+            i for i in range(next_index, len(conditions))
+            if conditions[i]["status"] == "UNKNOWN"
+        ]
+        if len(unknown_indices) > 1:
+            questions = _generate_questions_batch(
+                policy_name, conditions, unknown_indices, user_slots
+            )
+            question_cache = {
+                _question_cache_key(i, conditions[i], user_slots): question
+                for i, question in questions.items()
+            }
+            
+            if next_index in questions:
+                logger.info(
+                    "Questions batch generated",
+                    extra={
+                        "condition_index": next_index,
+                        "batch_size": len(questions)
+                    }
+                )
+                return {
+                    **state,
+                    "question_cache": question_cache,
+                    "current_question": questions[next_index],
+                    "current_condition_index": next_index
+                }
+        
         # Load prompt template
         prompt_path = Path(__file__).parent.parent.parent / "prompts" / "eligibility_question.jinja2"
         with open(prompt_path, 'r', encoding='utf-8') as f:
@@ -285,6 +334,99 @@ def generate_question_node(state: Dict[str, Any]) -> Dict[str, Any]:
         }
 
 
+def _question_cache_key(
+    index: int,
+    condition: Dict[str, Any],
+    user_slots: Dict[str, Any]
+) -> str:
+    """
+    배치 생성 질문의 캐시 키 (조건과 해당 조건의 슬롯 값)
+    
+    슬롯 값이 바뀌면 키가 달라져 이전 턴에 생성한 질문을 재사용하지 않음
+    
+    Args:
+        index: 조건 인덱스
+        condition: 조건
+        user_slots: 사용자 입력 슬롯
+    
+    Returns:
+        str: 캐시 키
+    """
+    slot_name = condition.get("type") or condition.get("name")
+    return json.dumps(
+        [
+            index,
+            condition.get("name"),
+            condition.get("type"),
+            condition.get("description"),
+            user_slots.get(slot_name)
+        ],
+        ensure_ascii=False,
+        default=str
+    )
+
+
+def _generate_questions_batch(
+    policy_name: str,
+    conditions: list[Dict[str, Any]],
+    indices: list[int],
+    user_slots: Dict[str, Any]
+) -> Dict[int, str]:
+    """
+    여러 조건의 질문을 하나의 LLM 호출로 생성
+    
+    Args:
+        policy_name: 정책명
+        conditions: 조건 리스트
+        indices: 질문을 생성할 조건 인덱스
+        user_slots: 이미 알고 있는 사용자 정보
+    
+    Returns:
+        Dict[int, str]: 조건 인덱스 → 질문 (실패 시 빈 dict)
+    """
+    items = [
+        {
+            "condition_index": i,
+            "condition_name": conditions[i].get("name"),
+            "condition_description": conditions[i].get("description"),
+            "condition_type": conditions[i].get("type")
+        }
+        for i in indices
+    ]
+    
+    try:
+        # Load prompt template
+        prompt_path = Path(__file__).parent.parent.parent / "prompts" / "eligibility_question_batch.jinja2"
+        with open(prompt_path, 'r', encoding='utf-8') as f:
+            template_str = f.read()
+        
+        template = Template(template_str)
+        system_prompt = template.render(
+            policy_name=policy_name,
+            user_slots=user_slots
+        )
+        
+        llm_client = get_openai_client()
+        results = llm_client.generate_structured_batch(
+            system_prompt=system_prompt,
+            items=items,
+            schema=ConditionQuestion,
+            temperature=0.3
+        )
+        return {
+            result["condition_index"]: result["question"].strip()
+            for result in results
+            if result["condition_index"] in indices
+        }
+        
+    except Exception as e:
+        logger.warning(
+            "Batch question generation failed, falling back to single question",
+            extra={"error": str(e)}
+        )
+        return {}
+
+
 @trace_workflow(name="process_answer", tags=["eligibility", "process"])
 def process_answer_node(state: Dict[str, Any]) -> Dict[str, Any]:
     """
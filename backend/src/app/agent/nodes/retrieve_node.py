@@ -42,7 +42,7 @@ def retrieve_from_db_node(state: Dict[str, Any]) -> Dict[str, Any]:
         
         # Generate query embedding
         embedder = get_embedder()
-        query_vector = embedder.embed_text(current_query)
+        query_vector = embedder.embed_query(current_query)
         
         # Search in Qdrant with policy filter
         qdrant_manager = get_qdrant_manager()
@@ -50,7 +50,8 @@ def retrieve_from_db_node(state: Dict[str, Any]) -> Dict[str, Any]:
             query_vector=query_vector,
             limit=5,
             score_threshold=0.7,
-            filter_dict={"policy_id": policy_id} if policy_id else None
+            filter_dict={"policy_id": policy_id} if policy_id else None,
+            with_payload=["content", "doc_type", "policy_id", "chunk_index"]
         )
         
         # Format retrieved documents
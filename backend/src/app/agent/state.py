@@ -46,6 +46,7 @@ class EligibilityState(TypedDict):
         user_slots: 사용자 입력 슬롯
         current_question: 현재 질문
         current_condition_index: 현재 조건 인덱스
+        question_cache: 배치로 미리 생성한 질문 (캐시 키 → 질문)
         final_result: 최종 결과
         reason: 판정 사유
     """
@@ -56,6 +57,7 @@ class EligibilityState(TypedDict):
     user_slots: Dict[str, Any]  # {"age": 25, "region": "서울", ...}
     current_question: str
     current_condition_index: int
+    question_cache: Dict[str, str]
     final_result: Literal["ELIGIBLE", "NOT_ELIGIBLE", "PARTIALLY"]
     reason: str
 
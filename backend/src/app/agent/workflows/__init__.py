@@ -1,9 +1,10 @@
 """Workflows module"""
 
-from .qa_workflow import create_qa_workflow, run_qa_workflow
+from .qa_workflow import create_qa_workflow, run_qa_workflow, prepare_qa_stream
 
 __all__ = [
     "create_qa_workflow",
     "run_qa_workflow",
+    "prepare_qa_stream",
 ]
 
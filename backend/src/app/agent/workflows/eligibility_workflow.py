@@ -184,6 +184,7 @@ def run_eligibility_start(
             "user_slots": {},
             "current_question": "",
             "current_condition_index": 0,
+            "question_cache": {},
             "final_result": "ELIGIBLE",
             "reason": ""
         }
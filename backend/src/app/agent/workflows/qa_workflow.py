@@ -3,6 +3,7 @@ Q&A Workflow
 LangGraph 기반 정책 Q&A 워크플로우
 """
 
+from functools import cache
 from typing import Dict, Any, Literal
 from langgraph.graph import StateGraph, END
 from langgraph.checkpoint.memory import MemorySaver
@@ -15,7 +16,8 @@ from ..nodes import (
     retrieve_from_db_node,
     check_sufficiency_node,
     web_search_node,
-    generate_answer_node
+    generate_answer_node,
+    build_answer_context
 )
 
 logger = get_logger()
@@ -46,7 +48,7 @@ def should_web_search(state: Dict[str, Any]) -> Literal["web_search", "generate_
     tags=get_feature_tags("QA"),
     metadata={"workflow_type": "qa"}
 )
-def create_qa_workflow() -> StateGraph:
+def create_qa_workflow(include_answer: bool = True) -> StateGraph:
     """
     Q&A 워크플로우 생성
     
@@ -57,6 +59,9 @@ def create_qa_workflow() -> StateGraph:
                                       ↓
                                  generate_answer → END
     
+    Args:
+        include_answer: False이면 generate_answer 대신 END로 연결 (스트리밍 답변용)
+    
     Returns:
         StateGraph: 컴파일된 워크플로우
     """
@@ -69,7 +74,12 @@ def create_qa_workflow() -> StateGraph:
         workflow.add_node("retrieve_from_db", retrieve_from_db_node)
         workflow.add_node("check_sufficiency", check_sufficiency_node)
         workflow.add_node("web_search", web_search_node)
-        workflow.add_node("generate_answer", generate_answer_node)
+        
+        if include_answer:
+            workflow.add_node("generate_answer", generate_answer_node)
+            answer_target = "generate_answer"
+        else:
+            answer_target = END
         
         # Set entry point
         workflow.set_entry_point("classify_query")
@@ -84,15 +94,16 @@ def create_qa_workflow() -> StateGraph:
             should_web_search,
             {
                 "web_search": "web_search",
-                "generate_answer": "generate_answer"
+                "generate_answer": answer_target
             }
         )
         
         # web_search → generate_answer
-        workflow.add_edge("web_search", "generate_answer")
+        workflow.add_edge("web_search", answer_target)
         
         # generate_answer → END
-        workflow.add_edge("generate_answer", END)
+        if include_answer:
+            workflow.add_edge("generate_answer", END)
         
         logger.info("Q&A workflow created successfully")
         
@@ -107,6 +118,44 @@ def create_qa_workflow() -> StateGraph:
         raise
 
 
+def _initial_state(
+    session_id: str,
+    policy_id: int,
+    user_query: str,
+    messages: list[Dict[str, str]] = None
+) -> QAState:
+    """
+    Q&A 워크플로우 초기 상태 생성
+    
+    Args:
+        session_id: 세션 ID
+        policy_id: 정책 ID
+        user_query: 사용자 질문
+        messages: 대화 이력 (선택)
+    
+    Returns:
+        QAState: 초기 상태
+    """
+    return {
+        "session_id": session_id,
+        "policy_id": policy_id,
+        "messages": messages or [],
+        "current_query": user_query,
+        "retrieved_docs": [],
+        "web_sources": [],
+        "answer": "",
+        "need_web_search": False,
+        "evidence": [],
+        "error": None
+    }
+
+
+@cache
+def _get_retrieval_app():
+    """generate_answer를 제외한 Q&A 그래프 (스트리밍용, 한 번만 컴파일)"""
+    return create_qa_workflow(include_answer=False).compile()
+
+
 @trace_workflow(
     name="run_qa_workflow",
     tags=get_feature_tags("QA"),
@@ -138,23 +187,12 @@ def run_qa_workflow(
         memory = MemorySaver()
         app = workflow.compile(checkpointer=memory)
         
-        # Initial state
-        initial_state: QAState = {
-            "session_id": session_id,
-            "policy_id": policy_id,
-            "messages": messages or [],
-            "current_query": user_query,
-            "retrieved_docs": [],
-            "web_sources": [],
-            "answer": "",
-            "need_web_search": False,
-            "evidence": [],
-            "error": None
-        }
-        
         # Run workflow
         config = {"configurable": {"thread_id": session_id}}
-        result = app.invoke(initial_state, config=config)
+        result = app.invoke(
+            _initial_state(session_id, policy_id, user_query, messages),
+            config=config
+        )
         
         logger.info(
             "Q&A workflow completed",
@@ -185,3 +223,50 @@ def run_qa_workflow(
             "error": str(e)
         }
 
+
+@trace_workflow(
+    name="prepare_qa_stream",
+    tags=get_feature_tags("QA"),
+    metadata={"action": "stream"}
+)
+def prepare_qa_stream(
+    session_id: str,
+    policy_id: int,
+    user_query: str,
+    messages: list[Dict[str, str]] = None
+) -> Dict[str, Any]:
+    """
+    스트리밍 답변을 위한 Q&A 워크플로우 전처리
+    
+    generate_answer 이전까지 같은 그래프(라우팅 포함)를 실행하고,
+    LLM 메시지와 근거 목록을 상태에 담아 반환합니다.
+    
+    Args:
+        session_id: 세션 ID
+        policy_id: 정책 ID
+        user_query: 사용자 질문
+        messages: 대화 이력 (선택)
+    
+    Returns:
+        Dict: 워크플로우 상태 (llm_messages, evidence 포함)
+    """
+    state = _get_retrieval_app().invoke(
+        _initial_state(session_id, policy_id, user_query, messages)
+    )
+    
+    llm_messages, evidence = build_answer_context(state)
+    
+    logger.info(
+        "Q&A stream prepared",
+        extra={
+            "session_id": session_id,
+            "policy_id": policy_id,
+            "evidence_count": len(evidence)
+        }
+    )
+    
+    return {
+        **state,
+        "llm_messages": llm_messages,
+        "evidence": evidence
+    }
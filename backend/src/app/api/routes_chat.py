@@ -3,8 +3,13 @@ Chat API Routes
 Q&A 멀티턴 대화 엔드포인트
 """
 
+import asyncio
+import json
 import uuid
+from typing import AsyncIterator, Optional
+
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
 
 from ..agent import AgentController
 from ..domain.chat import ChatRequest, ChatResponse, SessionResetResponse
@@ -51,8 +56,9 @@ async def chat(request: ChatRequest):
         # Generate session_id if not provided
         session_id = request.session_id or str(uuid.uuid4())
         
-        # Run Q&A workflow
-        result = AgentController.run_qa(
+        # Run Q&A workflow (blocking LLM / retrieval calls run off the event loop)
+        result = await asyncio.to_thread(
+            AgentController.run_qa,
             session_id=session_id,
             policy_id=request.policy_id,
             user_message=request.message
@@ -75,6 +81,54 @@ async def chat(request: ChatRequest):
         )
 
 
+def _sse_event(data: str, event: Optional[str] = None) -> str:
+    """
+    SSE 이벤트 프레이밍 (멀티라인 데이터는 data: 라인으로 분리)
+    
+    Args:
+        data: 전송할 데이터
+        event: 이벤트 이름 (선택)
+    
+    Returns:
+        str: SSE 형식 문자열
+    """
+    lines = [f"event: {event}"] if event else []
+    lines.extend(f"data: {line}" for line in data.split("\n"))
+    return "\n".join(lines) + "\n\n"
+
+
+@router.post(
+    "/chat/stream",
+    summary="Q&A 채팅 (스트리밍)",
+    description="특정 정책에 대한 Q&A 답변을 SSE(text/event-stream)로 토큰 단위 스트리밍합니다.",
+    tags=["Chat"]
+)
+async def chat_stream(request: ChatRequest):
+    """
+    Q&A 채팅 스트리밍 API
+    
+    **이벤트:**
+    - (기본) data: 답변 토큰
+    - done: 세션 ID, 근거(evidence) JSON
+    - error: 에러 메시지 JSON
+    """
+    session_id = request.session_id or str(uuid.uuid4())
+    
+    async def event_stream() -> AsyncIterator[str]:
+        async for event in AgentController.stream_qa(
+            session_id=session_id,
+            policy_id=request.policy_id,
+            user_message=request.message
+        ):
+            event_type = event.pop("type")
+            if event_type == "token":
+                yield _sse_event(event["content"])
+            else:
+                yield _sse_event(json.dumps(event, ensure_ascii=False), event=event_type)
+    
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
+
+
 @router.post(
     "/session/reset",
     response_model=SessionResetResponse,
@@ -3,6 +3,7 @@ Eligibility API Routes
 자격 확인 API 라우터
 """
 
+import asyncio
 from typing import Dict, Any
 from fastapi import APIRouter, HTTPException, Depends
 from sqlalchemy.orm import Session
@@ -60,7 +61,8 @@ async def start_eligibility_check(
         session_id = request.session_id or str(uuid.uuid4())
         
         # Run workflow
-        result = run_eligibility_start(
+        result = await asyncio.to_thread(
+            run_eligibility_start,
             session_id=session_id,
             policy_id=request.policy_id,
             apply_target=policy.apply_target
@@ -126,7 +128,8 @@ async def answer_eligibility_question(
         current_state = _eligibility_sessions[session_id]
         
         # Run workflow with answer
-        result = run_eligibility_answer(
+        result = await asyncio.to_thread(
+            run_eligibility_answer,
             session_id=session_id,
             user_answer=request.answer,
             current_state=current_state
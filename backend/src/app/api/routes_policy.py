@@ -3,6 +3,7 @@ Policy API Routes
 정책 검색 및 조회 엔드포인트
 """
 
+import asyncio
 from typing import Optional
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
@@ -49,7 +50,9 @@ async def search_policies(
     try:
         search_service = PolicySearchService(db)
         
-        policies, total = search_service.hybrid_search(
+        # Blocking Qdrant / MySQL / web calls run off the event loop
+        policies, total = await asyncio.to_thread(
+            search_service.hybrid_search,
             query=query,
             region=region,
             category=category,
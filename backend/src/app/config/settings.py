@@ -3,7 +3,7 @@ Application settings using Pydantic Settings
 환경변수를 자동으로 로드하고 검증합니다.
 """
 
-from functools import lru_cache
+from functools import cache
 from typing import Optional
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -27,6 +27,19 @@ class Settings(BaseSettings):
     qdrant_url: str
     qdrant_collection: str = "policies"
     qdrant_api_key: Optional[str] = None
+    qdrant_prefer_grpc: bool = True  # gRPC(HTTP/2) 채널 사용, 비활성화 시 REST
+    qdrant_grpc_port: int = 6334
+    qdrant_quantization: str = "binary"  # none, scalar, binary (컬렉션 생성 시 적용)
+    qdrant_hnsw_m: int = 32  # 컬렉션 생성 시 적용
+    qdrant_hnsw_ef_construct: int = 256  # 컬렉션 생성 시 적용
+    qdrant_full_scan_threshold: int = 10000  # KB, 컬렉션 생성 시 적용
+    qdrant_indexing_threshold: int = 10000  # KB, 컬렉션 생성 시 적용
+    qdrant_hnsw_ef: int = 128  # 검색 시 HNSW 탐색 폭
+    qdrant_query_cache_size: int = 1000  # 시맨틱 검색 캐시 항목 수 (0이면 비활성화)
+    qdrant_query_cache_ttl: float = 300.0  # 초
+    qdrant_query_cache_threshold: float = 0.97  # 캐시 히트 최소 코사인 유사도
+    search_mmr_lambda: Optional[float] = None  # 설정 시 정책 검색 결과에 MMR 다양화 적용 (예: 0.7)
+    policy_payload_complete: bool = False  # Qdrant 페이로드에 정책 응답 필드가 모두 적재된 경우 MySQL 조회 생략
     
     # OpenAI
     openai_api_key: str
@@ -36,9 +49,18 @@ class Settings(BaseSettings):
     # Embedding Model
     embedding_model: str = "BAAI/bge-m3"
     embedding_dimension: int = 1024
+    query_embedding_cache_size: int = 1024
+    embedding_device: str = "auto"  # auto, cpu, cuda
+    embedding_cache_dir: Optional[str] = None  # 설정 시 embed_batch 결과를 디스크에 캐시
+    embedder_warmup: bool = True  # 앱 시작 시 임베딩 모델 로드 및 더미 인코딩 (테스트에서는 비활성화)
     
     # Web Search
     tavily_api_key: Optional[str] = None
+    web_search_timeout: float = 5.0  # 하이브리드 검색에서 웹 검색 대기 시간 (초)
+    web_search_speculative: bool = False  # 벡터 검색과 웹 검색을 미리 병렬 실행 (풀에 여유가 있을 때만, 결과가 충분해도 Tavily 호출 발생)
+    web_search_max_workers: int = 8  # 웹 검색 전용 스레드 수
+    web_search_cache_size: int = 512  # Tavily 검색 결과 캐시 항목 수
+    web_search_cache_ttl: float = 600.0  # 초
     
     # LangSmith (Observability)
     langsmith_api_key: Optional[str] = None
@@ -65,7 +87,7 @@ class Settings(BaseSettings):
     )
 
 
-@lru_cache()
+@cache
 def get_settings() -> Settings:
     """
     Get cached settings instance
@@ -97,10 +97,10 @@ class Policy(Base):
     
     # Indexes
     __table_args__ = (
-        Index("idx_region", "region"),
-        Index("idx_category", "category"),
-        Index("idx_program_name", "program_name"),
-        Index("idx_created_at", "created_at"),
+        Index("idx_policies_region", "region"),
+        Index("idx_policies_category", "category"),
+        Index("idx_policies_program_name", "program_name"),
+        Index("idx_policies_created_at", "created_at"),
     )
     
     def __repr__(self) -> str:
@@ -129,8 +129,8 @@ class Document(Base):
     
     # Indexes
     __table_args__ = (
-        Index("idx_policy_id", "policy_id"),
-        Index("idx_doc_type", "doc_type"),
+        Index("idx_documents_policy_id", "policy_id"),
+        Index("idx_documents_doc_type", "doc_type"),
     )
     
     def __repr__(self) -> str:
@@ -163,10 +163,10 @@ class Session(Base):
     
     # Indexes
     __table_args__ = (
-        Index("idx_user_id", "user_id"),
-        Index("idx_policy_id", "policy_id"),
-        Index("idx_workflow_type", "workflow_type"),
-        Index("idx_created_at", "created_at"),
+        Index("idx_sessions_user_id", "user_id"),
+        Index("idx_sessions_policy_id", "policy_id"),
+        Index("idx_sessions_workflow_type", "workflow_type"),
+        Index("idx_sessions_created_at", "created_at"),
     )
     
     def __repr__(self) -> str:
@@ -193,8 +193,8 @@ class Slot(Base):
     
     # Indexes
     __table_args__ = (
-        Index("idx_session_id", "session_id"),
-        Index("idx_slot_name", "slot_name"),
+        Index("idx_slots_session_id", "session_id"),
+        Index("idx_slots_slot_name", "slot_name"),
         UniqueConstraint("session_id", "slot_name", name="unique_session_slot"),
     )
     
@@ -227,9 +227,9 @@ class ChecklistResult(Base):
     
     # Indexes
     __table_args__ = (
-        Index("idx_session_id", "session_id"),
-        Index("idx_policy_id", "policy_id"),
-        Index("idx_result", "result"),
+        Index("idx_checklist_results_session_id", "session_id"),
+        Index("idx_checklist_results_policy_id", "policy_id"),
+        Index("idx_checklist_results_result", "result"),
     )
     
     def __repr__(self) -> str:
@@ -263,9 +263,9 @@ class WebSource(Base):
     
     # Indexes
     __table_args__ = (
-        Index("idx_session_id", "session_id"),
-        Index("idx_policy_id", "policy_id"),
-        Index("idx_source_type", "source_type"),
+        Index("idx_web_sources_session_id", "session_id"),
+        Index("idx_web_sources_policy_id", "policy_id"),
+        Index("idx_web_sources_source_type", "source_type"),
     )
     
     def __repr__(self) -> str:
@@ -293,9 +293,9 @@ class ChatHistory(Base):
     
     # Indexes
     __table_args__ = (
-        Index("idx_session_id", "session_id"),
-        Index("idx_role", "role"),
-        Index("idx_created_at", "created_at"),
+        Index("idx_chat_history_session_id", "session_id"),
+        Index("idx_chat_history_role", "role"),
+        Index("idx_chat_history_created_at", "created_at"),
     )
     
     def __repr__(self) -> str:
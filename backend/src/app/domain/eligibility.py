@@ -18,6 +18,13 @@ class Condition(BaseModel):
     reason: Optional[str] = Field(None, description="판정 사유")
 
 
+class ConditionQuestion(BaseModel):
+    """조건별 확인 질문 (배치 생성 결과)"""
+    
+    condition_index: int = Field(..., description="조건 인덱스")
+    question: str = Field(..., description="사용자에게 할 질문")
+
+
 class EligibilityStartRequest(BaseModel):
     """자격 확인 시작 요청"""
     
@@ -3,11 +3,13 @@ OpenAI Client
 LLM 호출 래퍼
 """
 
-from typing import List, Dict, Any, Optional
-from functools import lru_cache
+import json
+from typing import List, Dict, Any, Optional, AsyncIterator, Type
 
+import openai
 from langchain_openai import ChatOpenAI
-from langchain_core.messages import HumanMessage, AIMessage, SystemMessage
+from pydantic import BaseModel, ValidationError
+from langchain_core.messages import HumanMessage, AIMessage, SystemMessage, BaseMessage
 
 from ..config import get_settings
 from ..config.logger import get_logger
@@ -16,6 +18,9 @@ from ..observability import trace_llm_call
 logger = get_logger()
 settings = get_settings()
 
+# Transient OpenAI errors that callers are expected to retry
+RETRIABLE_ERRORS = (openai.RateLimitError, openai.APITimeoutError)
+
 
 class OpenAIClient:
     """
@@ -79,17 +84,7 @@ class OpenAIClient:
         """
         try:
             # Convert to LangChain messages
-            lc_messages = []
-            for msg in messages:
-                role = msg.get("role", "user")
-                content = msg.get("content", "")
-                
-                if role == "system":
-                    lc_messages.append(SystemMessage(content=content))
-                elif role == "assistant":
-                    lc_messages.append(AIMessage(content=content))
-                else:  # user
-                    lc_messages.append(HumanMessage(content=content))
+            lc_messages = self._to_langchain_messages(messages)
             
             # Generate response
             response = self.model.invoke(
@@ -100,6 +95,13 @@ class OpenAIClient:
             
             return response.content
             
+        except RETRIABLE_ERRORS as e:
+            # Expected transient errors: skip traceback formatting
+            logger.warning(
+                "Error generating response (retriable)",
+                extra={"error": str(e), "error_type": type(e).__name__}
+            )
+            raise
         except Exception as e:
             logger.error(
                 "Error generating response",
@@ -108,6 +110,140 @@ class OpenAIClient:
             )
             raise
     
+    def generate_structured_batch(
+        self,
+        system_prompt: str,
+        items: List[Dict[str, Any]],
+        schema: Type[BaseModel],
+        temperature: Optional[float] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        독립적인 여러 작업을 하나의 LLM 호출로 처리 (JSON 배열 응답)
+        
+        Args:
+            system_prompt: 시스템 프롬프트
+            items: 작업 입력 리스트
+            schema: 각 결과 항목의 Pydantic 스키마
+            temperature: 온도 (선택)
+        
+        Returns:
+            List[Dict]: 입력 순서대로 검증된 결과 리스트
+        
+        Raises:
+            ValueError: 응답이 JSON 배열이 아니거나 길이/스키마가 맞지 않는 경우
+        """
+        if not items:
+            return []
+        
+        user_message = (
+            f"다음 {len(items)}개 항목 각각에 대한 결과를 생성하세요.\n"
+            f"반드시 길이가 {len(items)}인 JSON 배열만 응답하고, 입력 순서를 유지하세요.\n"
+            f"각 결과의 JSON 스키마:\n"
+            f"{json.dumps(schema.model_json_schema(), ensure_ascii=False)}\n\n"
+            f"항목:\n{json.dumps(items, ensure_ascii=False, indent=2)}"
+        )
+        
+        response = self.generate_with_system(
+            system_prompt,
+            user_message,
+            temperature=temperature
+        )
+        
+        # Extract JSON from response (remove markdown if present)
+        response_clean = response.strip()
+        if "```json" in response_clean:
+            response_clean = response_clean.split("```json")[1].split("```")[0].strip()
+        elif "```" in response_clean:
+            response_clean = response_clean.split("```")[1].split("```")[0].strip()
+        
+        try:
+            results = json.loads(response_clean)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid JSON in batch response: {e}") from e
+        
+        if not isinstance(results, list) or len(results) != len(items):
+            raise ValueError(
+                f"Expected JSON array of length {len(items)} in batch response"
+            )
+        
+        try:
+            return [schema.model_validate(result).model_dump() for result in results]
+        except ValidationError as e:
+            raise ValueError(f"Batch response does not match schema: {e}") from e
+    
+    @trace_llm_call(
+        name="stream_response",
+        tags=["llm", "openai", "stream"],
+        metadata={"model": settings.openai_model}
+    )
+    async def stream(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None
+    ) -> AsyncIterator[str]:
+        """
+        메시지 기반 응답 스트리밍 (토큰 단위)
+        
+        Args:
+            messages: 메시지 리스트 [{"role": "user/assistant/system", "content": str}]
+            temperature: 온도 (선택)
+            max_tokens: 최대 토큰 (선택)
+        
+        Yields:
+            str: 생성된 응답 조각
+        """
+        try:
+            lc_messages = self._to_langchain_messages(messages)
+            
+            async for chunk in self.model.astream(
+                lc_messages,
+                temperature=temperature or self.temperature,
+                max_tokens=max_tokens
+            ):
+                if chunk.content:
+                    yield chunk.content
+            
+        except RETRIABLE_ERRORS as e:
+            # Expected transient errors: skip traceback formatting
+            logger.warning(
+                "Error streaming response (retriable)",
+                extra={"error": str(e), "error_type": type(e).__name__}
+            )
+            raise
+        except Exception as e:
+            logger.error(
+                "Error streaming response",
+                extra={"error": str(e)},
+                exc_info=True
+            )
+            raise
+    
+    @staticmethod
+    def _to_langchain_messages(messages: List[Dict[str, str]]) -> List[BaseMessage]:
+        """
+        메시지 딕셔너리를 LangChain 메시지로 변환
+        
+        Args:
+            messages: 메시지 리스트
+        
+        Returns:
+            List[BaseMessage]: LangChain 메시지 리스트
+        """
+        lc_messages = []
+        for msg in messages:
+            role = msg.get("role", "user")
+            content = msg.get("content", "")
+            
+            if role == "system":
+                lc_messages.append(SystemMessage(content=content))
+            elif role == "assistant":
+                lc_messages.append(AIMessage(content=content))
+            else:  # user
+                lc_messages.append(HumanMessage(content=content))
+        
+        return lc_messages
+    
     def generate_with_system(
         self,
         system_prompt: str,
@@ -133,13 +269,20 @@ class OpenAIClient:
         return self.generate(messages, temperature=temperature)
 
 
-@lru_cache()
+# Singleton instance (요청마다 호출되므로 캐시 래퍼 대신 모듈 변수 조회)
+_openai_client: Optional[OpenAIClient] = None
+
+
 def get_openai_client() -> OpenAIClient:
     """
-    Get cached OpenAI client instance
+    Get OpenAI client singleton
     
     Returns:
-        OpenAIClient: Cached client instance
+        OpenAIClient: OpenAI 클라이언트 인스턴스
     """
-    return OpenAIClient()
-
+    global _openai_client
+    
+    if _openai_client is None:
+        _openai_client = OpenAIClient()
+    
+    return _openai_client
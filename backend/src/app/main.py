@@ -3,16 +3,22 @@ FastAPI Application Entrypoint
 정책·지원금 AI Agent의 메인 애플리케이션
 """
 
+import asyncio
+import json
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import Response
 
 from .config import get_settings
 from .config.logger import get_logger
 from .db.engine import init_db, close_db
+from .observability import get_langsmith_client
+from .llm import get_openai_client
+from .vector_store import get_embedder, get_qdrant_manager
+from .web_search.clients.tavily_client import get_tavily_client
 from .api import routes_policy, routes_admin, routes_chat, routes_eligibility, routes_web_source
 
 # Initialize
@@ -20,6 +26,17 @@ settings = get_settings()
 logger = get_logger()
 
 
+def _warmup_embedder() -> None:
+    """임베딩 모델 로드 및 더미 인코딩"""
+    get_embedder().embed_text("warmup")
+
+
+def _warmup_qdrant() -> None:
+    """Qdrant 클라이언트 생성 및 연결(gRPC 채널) 수립"""
+    qdrant_manager = get_qdrant_manager()
+    qdrant_manager.client.get_collection(qdrant_manager.collection_name)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator:
     """
@@ -32,13 +49,37 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
     init_db()
     logger.info("Database initialized")
     
-    # Initialize LangSmith (if enabled)
-    if settings.langsmith_tracing:
-        import os
-        os.environ["LANGCHAIN_TRACING_V2"] = "true"
-        os.environ["LANGCHAIN_API_KEY"] = settings.langsmith_api_key or ""
-        os.environ["LANGCHAIN_PROJECT"] = settings.langsmith_project
-        logger.info("LangSmith tracing enabled", extra={"project": settings.langsmith_project})
+    # Initialize LangSmith (env vars are set once by the cached client)
+    get_langsmith_client()
+    
+    # Warm up LLM client so the first request doesn't pay the init cost
+    try:
+        get_openai_client()
+        logger.info("OpenAI client warmed up")
+    except Exception as e:
+        logger.warning("OpenAI client warmup failed", extra={"error": str(e)})
+    
+    # Load the embedding model and run a dummy encode (runs once per worker),
+    # so the first search doesn't pay model load / CUDA init latency
+    if settings.embedder_warmup:
+        try:
+            await asyncio.to_thread(_warmup_embedder)
+            logger.info("Embedding model warmed up")
+        except Exception as e:
+            logger.warning("Embedding model warmup failed", extra={"error": str(e)})
+    
+    # Create search clients up front so the first request doesn't pay connection setup
+    try:
+        await asyncio.to_thread(_warmup_qdrant)
+        logger.info("Qdrant client warmed up")
+    except Exception as e:
+        logger.warning("Qdrant client warmup failed", extra={"error": str(e)})
+    
+    try:
+        get_tavily_client()
+        logger.info("Tavily client warmed up")
+    except Exception as e:
+        logger.warning("Tavily client warmup failed", extra={"error": str(e)})
     
     yield
     
@@ -60,10 +101,11 @@ app = FastAPI(
 # Add CORS middleware
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=settings.cors_origins,
+    allow_origins=tuple(settings.cors_origins),
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=("GET", "POST", "PUT", "DELETE", "OPTIONS"),
+    allow_headers=("Authorization", "Content-Type", "X-Request-Id"),
+    max_age=86400,  # Cache preflight responses for 24h
 )
 
 
@@ -71,20 +113,38 @@ app.add_middleware(
 # Health Check Endpoints
 # ============================================================
 
+def _to_json_bytes(content: dict) -> bytes:
+    """Serialize content the same way JSONResponse does"""
+    return json.dumps(
+        content,
+        ensure_ascii=False,
+        allow_nan=False,
+        indent=None,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+# Static bodies are precomputed once since settings don't change at runtime
+_HEALTH_BYTES = _to_json_bytes({
+    "status": "healthy",
+    "service": settings.app_name,
+    "environment": settings.environment,
+})
+
+_ROOT_BYTES = _to_json_bytes({
+    "service": settings.app_name,
+    "version": "1.0.0",
+    "status": "running",
+    "docs": "/docs" if settings.debug else "disabled",
+})
+
 @app.get("/health", tags=["Health"])
 async def health_check():
     """
     Health check endpoint
     컨테이너 헬스체크용 엔드포인트
     """
-    return JSONResponse(
-        status_code=200,
-        content={
-            "status": "healthy",
-            "service": settings.app_name,
-            "environment": settings.environment,
-        }
-    )
+    return Response(content=_HEALTH_BYTES, media_type="application/json")
 
 
 @app.get("/", tags=["Root"])
@@ -93,12 +153,7 @@ async def root():
     Root endpoint
     API 기본 정보 제공
     """
-    return {
-        "service": settings.app_name,
-        "version": "1.0.0",
-        "status": "running",
-        "docs": "/docs" if settings.debug else "disabled",
-    }
+    return Response(content=_ROOT_BYTES, media_type="application/json")
 
 
 # ============================================================
@@ -116,35 +171,50 @@ app.include_router(routes_web_source.router)
 # Exception Handlers
 # ============================================================
 
+_INTERNAL_ERR_BYTES = _to_json_bytes({
+    "error": "Internal server error",
+    "message": "An error occurred",
+})
+
+
 @app.exception_handler(Exception)
 async def global_exception_handler(request, exc):
     """Global exception handler"""
+    exc_str = str(exc)
     logger.error(
         "Unhandled exception",
         extra={
             "path": request.url.path,
             "method": request.method,
-            "error": str(exc),
+            "error": exc_str,
         },
         exc_info=True
     )
-    return JSONResponse(
-        status_code=500,
-        content={
+    
+    if settings.debug:
+        body = _to_json_bytes({
             "error": "Internal server error",
-            "message": str(exc) if settings.debug else "An error occurred",
-        }
-    )
+            "message": exc_str,
+        })
+    else:
+        body = _INTERNAL_ERR_BYTES
+    
+    return Response(content=body, media_type="application/json", status_code=500)
 
 
 if __name__ == "__main__":
+    from importlib.util import find_spec
+    
     import uvicorn
     
+    # uvloop/httptools를 명시적으로 사용 (설치되지 않은 플랫폼에서는 기본 구현)
     uvicorn.run(
         "main:app",
         host="0.0.0.0",
         port=settings.port,
         reload=settings.debug,
+        loop="uvloop" if find_spec("uvloop") else "asyncio",
+        http="httptools" if find_spec("httptools") else "h11",
         log_level="debug" if settings.debug else "info",
     )
 
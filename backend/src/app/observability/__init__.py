@@ -4,7 +4,7 @@ LangSmith Observability Module
 """
 
 from .langsmith_client import LangSmithClient, get_langsmith_client
-from .tracing import trace_workflow, trace_llm_call, trace_retrieval, trace_tool
+from .tracing import trace_workflow, trace_llm_call, trace_retrieval, trace_tool, trace_db_operation
 from .tags import get_base_tags, get_feature_tags
 
 __all__ = [
@@ -14,6 +14,7 @@ __all__ = [
     "trace_llm_call",
     "trace_retrieval",
     "trace_tool",
+    "trace_db_operation",
     "get_base_tags",
     "get_feature_tags",
 ]
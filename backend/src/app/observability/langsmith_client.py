@@ -5,7 +5,6 @@ LangSmith API와의 통신을 담당합니다.
 
 import os
 from typing import Optional
-from functools import lru_cache
 
 from langsmith import Client
 
@@ -44,7 +43,8 @@ class LangSmithClient:
                 os.environ["LANGCHAIN_TRACING_V2"] = "true"
                 os.environ["LANGCHAIN_API_KEY"] = settings.langsmith_api_key
                 os.environ["LANGCHAIN_PROJECT"] = self.project_name
-                os.environ["LANGCHAIN_ENDPOINT"] = settings.langsmith_endpoint
+                if settings.langsmith_endpoint:
+                    os.environ["LANGCHAIN_ENDPOINT"] = settings.langsmith_endpoint
                 
                 logger.info(
                     "LangSmith client initialized",
@@ -83,13 +83,20 @@ class LangSmithClient:
         return self.enabled and self.client is not None
 
 
-@lru_cache()
+# Singleton instance (요청마다 호출되므로 캐시 래퍼 대신 모듈 변수 조회)
+_langsmith_client: Optional[LangSmithClient] = None
+
+
 def get_langsmith_client() -> LangSmithClient:
     """
-    Get cached LangSmith client instance
+    Get LangSmith client singleton
     
     Returns:
-        LangSmithClient: Cached client instance
+        LangSmithClient: LangSmith 클라이언트 인스턴스
     """
-    return LangSmithClient()
-
+    global _langsmith_client
+    
+    if _langsmith_client is None:
+        _langsmith_client = LangSmithClient()
+    
+    return _langsmith_client
@@ -4,10 +4,18 @@ Run Tags 관리
 """
 
 from typing import Optional
-import os
 
 from ..config import get_settings
 
+# Environment is fixed at startup, so the base tags are computed once
+_BASE_TAGS: tuple[str, ...] = (f"env:{get_settings().environment}",)
+
+_FEATURE_MAP = {
+    "PS": "Policy-Search",
+    "QA": "Q&A",
+    "EC": "Eligibility-Check"
+}
+
 
 def get_base_tags() -> list[str]:
     """
@@ -20,8 +28,7 @@ def get_base_tags() -> list[str]:
         >>> get_base_tags()
         ['env:development']
     """
-    settings = get_settings()
-    return [f"env:{settings.environment}"]
+    return list(_BASE_TAGS)
 
 
 def get_feature_tags(
@@ -47,15 +54,10 @@ def get_feature_tags(
         >>> get_feature_tags("QA", policy_id=1)
         ['env:development', 'feature:QA', 'policy:1']
     """
-    tags = get_base_tags()
+    tags = [*_BASE_TAGS]
     
     # Add feature tag
-    feature_map = {
-        "PS": "Policy-Search",
-        "QA": "Q&A",
-        "EC": "Eligibility-Check"
-    }
-    feature_name = feature_map.get(feature, feature)
+    feature_name = _FEATURE_MAP.get(feature, feature)
     tags.append(f"feature:{feature_name}")
     
     # Add policy ID if provided
@@ -89,7 +91,7 @@ def get_workflow_tags(
         >>> get_workflow_tags("qa", session_id="abc-123", policy_id=1)
         ['env:development', 'workflow:qa', 'session:abc-123', 'policy:1']
     """
-    tags = get_base_tags()
+    tags = [*_BASE_TAGS]
     
     # Add workflow type
     tags.append(f"workflow:{workflow_type}")
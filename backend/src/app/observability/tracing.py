@@ -3,6 +3,8 @@ LangSmith 트레이싱 데코레이터 및 유틸리티
 워크플로우 및 LLM 호출을 트레이싱합니다.
 """
 
+import inspect
+import logging
 from functools import wraps
 from typing import Any, Callable, Dict, Optional, TypeVar, cast
 
@@ -53,6 +55,32 @@ def trace_workflow(
             # LangSmith가 비활성화된 경우 원본 함수 반환
             return func
         
+        if inspect.isasyncgenfunction(func):
+            # Keep the run open until the stream is exhausted
+            @wraps(func)
+            @traceable(
+                name=name,
+                tags=tags or [],
+                metadata=metadata or {},
+                run_type=run_type
+            )
+            async def stream_wrapper(*args: Any, **kwargs: Any) -> Any:
+                try:
+                    async for item in func(*args, **kwargs):
+                        yield item
+                except Exception as e:
+                    logger.error(
+                        f"Error in traced workflow: {name}",
+                        extra={
+                            "workflow": name,
+                            "error": str(e)
+                        },
+                        exc_info=True
+                    )
+                    raise
+            
+            return cast(F, stream_wrapper)
+        
         @wraps(func)
         @traceable(
             name=name,
@@ -62,19 +90,22 @@ def trace_workflow(
         )
         def wrapper(*args: Any, **kwargs: Any) -> Any:
             try:
-                logger.debug(
-                    f"Starting traced workflow: {name}",
-                    extra={
-                        "workflow": name,
-                        "tags": tags,
-                        "run_type": run_type
-                    }
-                )
+                debug_enabled = logger.isEnabledFor(logging.DEBUG)
+                if debug_enabled:
+                    logger.debug(
+                        f"Starting traced workflow: {name}",
+                        extra={
+                            "workflow": name,
+                            "tags": tags,
+                            "run_type": run_type
+                        }
+                    )
                 result = func(*args, **kwargs)
-                logger.debug(
-                    f"Completed traced workflow: {name}",
-                    extra={"workflow": name}
-                )
+                if debug_enabled:
+                    logger.debug(
+                        f"Completed traced workflow: {name}",
+                        extra={"workflow": name}
+                    )
                 return result
             except Exception as e:
                 logger.error(
@@ -174,3 +205,27 @@ def trace_tool(
         run_type="tool"
     )
 
+
+
+def trace_db_operation(
+    name: str,
+    tags: Optional[list[str]] = None,
+    metadata: Optional[Dict[str, Any]] = None
+) -> Callable[[F], F]:
+    """
+    DB 작업을 트레이싱하는 데코레이터
+    
+    Args:
+        name: 트레이스 이름
+        tags: 태그 리스트
+        metadata: 메타데이터
+    
+    Returns:
+        Callable: 데코레이터 함수
+    """
+    return trace_workflow(
+        name=name,
+        tags=tags,
+        metadata=metadata,
+        run_type="tool"
+    )
@@ -3,19 +3,104 @@ Policy Search Service
 정책 검색 비즈니스 로직 (Hybrid Search: Qdrant + MySQL + Web Search)
 """
 
-from typing import List, Optional, Dict, Any
-from sqlalchemy.orm import Session
+import contextvars
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from itertools import islice
+from typing import Any, Callable, Dict, List, Optional
+from sqlalchemy.orm import Session, load_only
 from datetime import datetime
+from pydantic import ValidationError
+import numpy as np
 
 from ..db.models import Policy
 from ..db.repositories import PolicyRepository
 from ..vector_store import get_qdrant_manager, get_embedder
+from ..vector_store.mmr import mmr_select
 from ..domain.policy import PolicyResponse
+from ..config import get_settings
 from ..config.logger import get_logger
 from ..observability import trace_workflow, get_feature_tags
-from ..web_search.clients import TavilySearchClient
+from ..web_search.clients.tavily_client import get_tavily_client
 
 logger = get_logger()
+settings = get_settings()
+
+# Dedicated pool for web searches (services are created per request)
+_web_search_executor = ThreadPoolExecutor(
+    max_workers=settings.web_search_max_workers,
+    thread_name_prefix="web_search"
+)
+# Idle workers; speculation is skipped when none is free so it never queues
+_web_search_slots = threading.BoundedSemaphore(settings.web_search_max_workers)
+
+# Qdrant payload key holding the policy fields (see policy_to_payload)
+POLICY_PAYLOAD_KEY = "policy"
+
+# Policy columns read by PolicySearchService._to_response
+_RESPONSE_COLUMNS = (
+    Policy.id,
+    Policy.program_id,
+    Policy.region,
+    Policy.category,
+    Policy.program_name,
+    Policy.program_overview,
+    Policy.support_description,
+    Policy.support_budget,
+    Policy.support_scale,
+    Policy.supervising_ministry,
+    Policy.apply_target,
+    Policy.announcement_date,
+    Policy.biz_process,
+    Policy.application_method,
+    Policy.contact_agency,
+    Policy.contact_number,
+    Policy.required_documents,
+    Policy.collected_date,
+    Policy.created_at,
+)
+
+
+def _submit_web_search(fn: Callable[..., Any], **kwargs: Any) -> Future:
+    """
+    웹 검색 풀에 작업 제출
+    
+    호출자의 contextvars(트레이싱 컨텍스트 등)를 복사해 워커에서 실행합니다.
+    
+    Args:
+        fn: 실행할 함수
+        **kwargs: 함수 인자
+    
+    Returns:
+        Future: 제출된 작업
+    """
+    return _web_search_executor.submit(contextvars.copy_context().run, fn, **kwargs)
+
+
+def _submit_speculative(fn: Callable[..., Any], **kwargs: Any) -> Optional[Future]:
+    """
+    웹 검색 풀에 유휴 워커가 있을 때만 작업 제출 (web_search_speculative 설정 시)
+    
+    제출된 작업은 결과가 필요 없어도 끝까지 실행됩니다.
+    
+    Args:
+        fn: 실행할 함수
+        **kwargs: 함수 인자
+    
+    Returns:
+        Optional[Future]: 제출된 작업 (비활성화되었거나 유휴 워커가 없으면 None)
+    """
+    if not settings.web_search_speculative or not _web_search_slots.acquire(blocking=False):
+        return None
+    
+    try:
+        future = _submit_web_search(fn, **kwargs)
+    except BaseException:
+        _web_search_slots.release()
+        raise
+    
+    future.add_done_callback(lambda _: _web_search_slots.release())
+    return future
 
 
 class PolicySearchService:
@@ -40,7 +125,7 @@ class PolicySearchService:
         self.policy_repo = PolicyRepository(db)
         self.qdrant_manager = get_qdrant_manager()
         self.embedder = get_embedder()
-        self.tavily_client = TavilySearchClient()
+        self.tavily_client = get_tavily_client()
     
     @trace_workflow(
         name="hybrid_search",
@@ -77,6 +162,13 @@ class PolicySearchService:
             total = 0
             
             if query:
+                # Optionally start web search speculatively so it overlaps the local search
+                web_future = _submit_speculative(
+                    self._web_search,
+                    query=query,
+                    max_results=limit
+                )
+                
                 # Vector search with Qdrant
                 logger.info(
                     "Performing hybrid search",
@@ -88,7 +180,7 @@ class PolicySearchService:
                     }
                 )
                 
-                policies = self._vector_search(
+                policy_responses = self._vector_search(
                     query=query,
                     region=region,
                     category=category,
@@ -96,12 +188,6 @@ class PolicySearchService:
                     offset=offset,
                     score_threshold=score_threshold
                 )
-                
-                # Convert to response models
-                policy_responses = [
-                    self._to_response(policy, score=getattr(policy, 'score', None))
-                    for policy in policies
-                ]
                 total = len(policy_responses)
                 
                 # DB 검색 결과가 적으면 웹 검색 추가
@@ -114,10 +200,24 @@ class PolicySearchService:
                         }
                     )
                     
-                    web_results = self._web_search(
-                        query=query,
-                        max_results=limit - total if total > 0 else limit
-                    )
+                    if web_future is None:
+                        web_future = _submit_web_search(
+                            self._web_search,
+                            query=query,
+                            max_results=limit
+                        )
+                    
+                    # Same timeout whether or not the search was started speculatively
+                    try:
+                        web_results = web_future.result(timeout=settings.web_search_timeout)
+                    except FutureTimeoutError:
+                        logger.warning(
+                            "Web search timed out",
+                            extra={"timeout": settings.web_search_timeout}
+                        )
+                        web_results = []
+                    
+                    web_results = web_results[:limit - total if total > 0 else limit]
                     
                     if web_results:
                         policy_responses.extend(web_results)
@@ -179,7 +279,7 @@ class PolicySearchService:
         limit: int,
         offset: int,
         score_threshold: float
-    ) -> List[Policy]:
+    ) -> List[PolicyResponse]:
         """
         벡터 검색 수행
         
@@ -192,10 +292,10 @@ class PolicySearchService:
             score_threshold: 최소 스코어
         
         Returns:
-            List[Policy]: 정책 리스트 (score 속성 추가)
+            List[PolicyResponse]: 정책 응답 리스트 (score 포함)
         """
         # Generate query embedding
-        query_vector = self.embedder.embed_text(query)
+        query_vector = self.embedder.embed_query(query)
         
         # Build filter
         filter_dict = {}
@@ -204,45 +304,121 @@ class PolicySearchService:
         if category:
             filter_dict["category"] = category
         
+        use_mmr = settings.search_mmr_lambda is not None
+        
         # Search in Qdrant
         results = self.qdrant_manager.search(
             query_vector=query_vector,
             limit=limit * 2,  # Get more results for deduplication
             score_threshold=score_threshold,
-            filter_dict=filter_dict if filter_dict else None
+            filter_dict=filter_dict if filter_dict else None,
+            with_vectors=use_mmr,
+            with_payload=(
+                ["policy_id", POLICY_PAYLOAD_KEY]
+                if settings.policy_payload_complete
+                else ["policy_id"]
+            )
         )
         
-        # Extract policy IDs and scores
-        policy_scores = {}
-        for result in results:
-            policy_id = result["payload"].get("policy_id")
-            score = result["score"]
-            
-            if policy_id:
-                # Keep highest score for each policy
-                if policy_id not in policy_scores or score > policy_scores[policy_id]:
-                    policy_scores[policy_id] = score
+        # Keep highest score for each policy
+        # (Qdrant returns results sorted by score, so the first hit wins;
+        # np.unique finds each policy's first hit without per-result branching)
+        result_policy_ids = np.fromiter(
+            (result["payload"].get("policy_id") or 0 for result in results),
+            dtype=np.int64,
+            count=len(results)
+        )
+        _, first_indices = np.unique(result_policy_ids, return_index=True)
+        first_indices.sort()
         
-        # Get policies from MySQL
-        unique_policy_ids = list(policy_scores.keys())
+        policy_scores: Dict[int, float] = {}
+        policy_payloads: Dict[int, Optional[Dict[str, Any]]] = {}
+        policy_vectors: Dict[int, List[float]] = {}
+        for index in first_indices.tolist():
+            policy_id = int(result_policy_ids[index])
+            if policy_id:
+                result = results[index]
+                policy_scores[policy_id] = result["score"]
+                policy_payloads[policy_id] = result["payload"].get(POLICY_PAYLOAD_KEY)
+                if use_mmr:
+                    policy_vectors[policy_id] = result["vector"]
         
-        if not unique_policy_ids:
+        if not policy_scores:
             logger.warning("No policies found in vector search")
             return []
         
-        # Fetch policies
-        policies = self.db.query(Policy).filter(
-            Policy.id.in_(unique_policy_ids)
-        ).all()
+        # Qdrant hits are already score-ordered; MMR re-ranks them for diversity
+        ranked_policy_ids = policy_scores
+        if use_mmr:
+            candidate_ids = list(policy_scores)
+            selected = mmr_select(
+                scores=[policy_scores[pid] for pid in candidate_ids],
+                vectors=[policy_vectors[pid] for pid in candidate_ids],
+                k=offset + limit,
+                lambda_mult=settings.search_mmr_lambda
+            )
+            ranked_policy_ids = [candidate_ids[i] for i in selected]
+        
+        page_policy_ids = list(islice(ranked_policy_ids, offset, offset + limit))
+        
+        if not page_policy_ids:
+            return []
         
-        # Add scores and sort
-        for policy in policies:
-            policy.score = policy_scores.get(policy.id, 0.0)
+        # Build responses straight from the Qdrant payload when it is complete
+        responses: Dict[int, PolicyResponse] = {}
+        if settings.policy_payload_complete:
+            for policy_id in page_policy_ids:
+                response = self._policy_from_payload(
+                    policy_payloads.get(policy_id),
+                    score=policy_scores[policy_id]
+                )
+                if response is not None:
+                    responses[policy_id] = response
         
-        policies.sort(key=lambda p: p.score, reverse=True)
+        # Fall back to MySQL for policies without a usable payload
+        missing_ids = [pid for pid in page_policy_ids if pid not in responses]
+        if missing_ids:
+            # Fetch only the columns needed for PolicyResponse
+            for policy in (
+                self.db.query(Policy)
+                .options(load_only(*_RESPONSE_COLUMNS))
+                .filter(Policy.id.in_(missing_ids))
+                .all()
+            ):
+                responses[policy.id] = self._to_response(
+                    policy,
+                    score=policy_scores[policy.id]
+                )
         
-        # Apply offset and limit
-        return policies[offset:offset + limit]
+        # Restore score order
+        return [
+            responses[policy_id]
+            for policy_id in page_policy_ids
+            if policy_id in responses
+        ]
+    
+    @staticmethod
+    def _policy_from_payload(
+        payload: Optional[Dict[str, Any]],
+        score: Optional[float] = None
+    ) -> Optional[PolicyResponse]:
+        """
+        Qdrant 페이로드의 정책 필드로 PolicyResponse 생성
+        
+        Args:
+            payload: policy_to_payload()로 적재된 정책 필드
+            score: 검색 스코어
+        
+        Returns:
+            Optional[PolicyResponse]: 정책 응답 모델 (필드 누락/불일치 시 None)
+        """
+        if not payload:
+            return None
+        
+        try:
+            return PolicyResponse(**payload, score=score)
+        except (TypeError, ValidationError):
+            return None
     
     def _web_search(
         self,
@@ -344,7 +520,8 @@ class PolicySearchService:
             )
             raise
     
-    def _to_response(self, policy: Policy, score: Optional[float] = None) -> PolicyResponse:
+    @staticmethod
+    def _to_response(policy: Policy, score: Optional[float] = None) -> PolicyResponse:
         """
         Policy 모델을 PolicyResponse로 변환
         
@@ -383,3 +560,27 @@ class PolicySearchService:
             score=score
         )
 
+
+def policy_to_payload(policy: Policy) -> Optional[Dict[str, Any]]:
+    """
+    Qdrant 페이로드에 저장할 정책 응답 필드 생성
+    
+    PolicyResponse로 검증할 수 없는 정책(예: application_method가 리스트)은
+    None을 반환하며, 검색 시 MySQL 조회로 대체됩니다.
+    
+    Args:
+        policy: Policy ORM 모델
+    
+    Returns:
+        Optional[Dict[str, Any]]: JSON 직렬화 가능한 PolicyResponse 필드 (score 제외)
+    """
+    try:
+        response = PolicySearchService._to_response(policy)
+    except ValidationError as e:
+        logger.warning(
+            "Policy payload skipped (validation failed)",
+            extra={"policy_id": policy.id, "error": str(e)}
+        )
+        return None
+    
+    return response.model_dump(mode="json", exclude={"score"})
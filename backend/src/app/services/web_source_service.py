@@ -5,6 +5,7 @@ Web Source Service
 
 from typing import List, Dict, Any, Optional
 from datetime import datetime
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 
 from ..config.logger import get_logger
@@ -44,29 +45,34 @@ class WebSourceService:
             sources: 웹 검색 결과 리스트
         
         Returns:
-            List[WebSource]: 저장된 웹 소스 리스트
+            List[WebSource]: 저장된 웹 소스 리스트 (세션에 연결되지 않은 객체, id 미포함)
         """
         try:
-            saved_sources = []
-            
-            for source in sources:
-                web_source = WebSource(
-                    session_id=session_id,
-                    policy_id=policy_id,
-                    query=query,
-                    url=source.get("url", ""),
-                    title=source.get("title", ""),
-                    snippet=source.get("snippet", ""),
-                    score=source.get("score"),
-                    fetched_date=source.get("fetched_date"),
-                    source_type=source.get("source_type", "unknown"),
-                    created_at=datetime.utcnow()
-                )
-                
-                self.db.add(web_source)
-                saved_sources.append(web_source)
+            created_at = datetime.utcnow()
+            rows = [
+                {
+                    "session_id": session_id,
+                    "policy_id": policy_id,
+                    "url": source.get("url", ""),
+                    "title": source.get("title", ""),
+                    "snippet": source.get("snippet", ""),
+                    "fetched_date": source.get("fetched_date"),
+                    "source_type": source.get("source_type", "unknown"),
+                    "source_metadata": {
+                        "query": query,
+                        "score": source.get("score")
+                    },
+                    "created_at": created_at
+                }
+                for source in sources
+            ]
             
-            self.db.commit()
+            if rows:
+                # Single executemany INSERT (bypasses ORM unit-of-work per row)
+                self.db.execute(insert(WebSource), rows)
+                self.db.commit()
+            
+            saved_sources = [WebSource(**row) for row in rows]
             
             logger.info(
                 "Web sources saved",
@@ -3,6 +3,8 @@
 from .qdrant_client import QdrantManager, get_qdrant_manager
 from .embedder_bge_m3 import BGEm3Embedder, get_embedder
 from .chunker import TextChunker, chunk_text
+from .embedding_cache import EmbeddingCache
+from .query_cache import QueryCache
 
 __all__ = [
     "QdrantManager",
@@ -11,5 +13,7 @@ __all__ = [
     "get_embedder",
     "TextChunker",
     "chunk_text",
+    "EmbeddingCache",
+    "QueryCache",
 ]
 
@@ -6,12 +6,29 @@ Text Chunking
 from typing import List, Dict, Any
 import re
 
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    # numba is optional: fall back to the plain Python loop
+    def njit(*args, **kwargs):
+        def decorator(func):
+            return func
+        return decorator
+
 from ..config import get_settings
 from ..config.logger import get_logger
 
 logger = get_logger()
 settings = get_settings()
 
+# Precompiled patterns
+_WHITESPACE_PATTERN = re.compile(r'\s+')
+
+# 한국어 문장 종결 부호: . ! ? 。 (공백이 아닌 문자로 시작하는 문장)
+_SENTENCE_PATTERN = re.compile(r'[^\s.!?。][^.!?。]*[.!?。]?')
+
 
 class TextChunker:
     """
@@ -67,45 +84,26 @@ class TextChunker:
         # Clean text
         text = self._clean_text(text)
         
-        # Split into sentences first (한국어 문장 분리)
-        sentences = self._split_into_sentences(text)
+        # Split into sentence spans first (한국어 문장 분리)
+        spans = self._split_into_sentences(text)
         
-        # Combine sentences into chunks
-        chunks = []
-        current_chunk = ""
-        current_length = 0
+        # Pack sentence spans into chunk boundaries, then slice once per chunk
+        bounds = _pack_chunks(
+            spans[:, 0],
+            spans[:, 1],
+            self.chunk_size,
+            self.chunk_overlap
+        )
         
-        for sentence in sentences:
-            sentence_length = len(sentence)
-            
-            # If adding this sentence exceeds chunk_size
-            if current_length + sentence_length > self.chunk_size and current_chunk:
-                # Save current chunk
+        chunks = []
+        for chunk_start, chunk_end in bounds.tolist():
+            content = text[chunk_start:chunk_end].strip()
+            if content:
                 chunks.append({
-                    "content": current_chunk.strip(),
+                    "content": content,
                     "metadata": metadata or {},
                     "chunk_index": len(chunks)
                 })
-                
-                # Start new chunk with overlap
-                overlap_text = self._get_overlap_text(current_chunk)
-                current_chunk = overlap_text + " " + sentence
-                current_length = len(current_chunk)
-            else:
-                # Add sentence to current chunk
-                if current_chunk:
-                    current_chunk += " " + sentence
-                else:
-                    current_chunk = sentence
-                current_length += sentence_length
-        
-        # Add last chunk
-        if current_chunk.strip():
-            chunks.append({
-                "content": current_chunk.strip(),
-                "metadata": metadata or {},
-                "chunk_index": len(chunks)
-            })
         
         logger.debug(
             "Text chunked",
@@ -127,50 +125,78 @@ class TextChunker:
         Returns:
             str: 정제된 텍스트
         """
-        # Remove multiple spaces
-        text = re.sub(r'\s+', ' ', text)
+        # Fast path: the only whitespace is single ASCII spaces
+        # (every other whitespace character is non-printable)
+        if "  " not in text and text.isprintable():
+            return text.strip()
         
-        # Remove multiple newlines
-        text = re.sub(r'\n+', '\n', text)
+        # Collapse all whitespace runs (including newlines) into single spaces
+        text = _WHITESPACE_PATTERN.sub(' ', text)
         
         return text.strip()
     
-    def _split_into_sentences(self, text: str) -> List[str]:
+    def _split_into_sentences(self, text: str) -> np.ndarray:
         """
-        텍스트를 문장으로 분리 (한국어 지원)
+        텍스트를 문장 단위 (start, end) 오프셋으로 분리 (한국어 지원)
         
         Args:
             text: 원본 텍스트
         
         Returns:
-            List[str]: 문장 리스트
+            np.ndarray: (문장 수, 2) 형태의 오프셋 배열 (종결 부호 포함)
         """
-        # 한국어 문장 종결 부호: . ! ? 。
-        sentence_endings = r'[.!?。]'
-        
-        # Split by sentence endings
-        sentences = re.split(sentence_endings, text)
-        
-        # Clean and filter empty sentences
-        sentences = [s.strip() for s in sentences if s.strip()]
-        
-        return sentences
+        return np.array(
+            [match.span() for match in _SENTENCE_PATTERN.finditer(text)],
+            dtype=np.int64
+        ).reshape(-1, 2)
+
+
+@njit(cache=True)
+def _pack_chunks(
+    starts: np.ndarray,
+    ends: np.ndarray,
+    chunk_size: int,
+    chunk_overlap: int
+) -> np.ndarray:
+    """
+    문장 오프셋을 청크 경계로 greedy 패킹 (numba 설치 시 JIT 컴파일)
     
-    def _get_overlap_text(self, text: str) -> str:
-        """
-        청크 겹침 텍스트 추출
-        
-        Args:
-            text: 원본 텍스트
-        
-        Returns:
-            str: 겹침 텍스트
-        """
-        if len(text) <= self.chunk_overlap:
-            return text
+    Args:
+        starts: 문장 시작 오프셋
+        ends: 문장 끝 오프셋
+        chunk_size: 청크 크기 (문자 수)
+        chunk_overlap: 청크 겹침 (문자 수)
+    
+    Returns:
+        np.ndarray: (청크 수, 2) 형태의 (start, end) 경계 배열
+    """
+    n = len(starts)
+    bounds = np.empty((n, 2), np.int64)
+    if n == 0:
+        return bounds
+    
+    count = 0
+    chunk_start = starts[0]
+    chunk_end = ends[0]
+    
+    for i in range(1, n):
+        # If adding this sentence exceeds chunk_size, close current chunk
+        if ends[i] - chunk_start > chunk_size:
+            bounds[count, 0] = chunk_start
+            bounds[count, 1] = chunk_end
+            count += 1
+            
+            # Start new chunk with overlap
+            chunk_start = max(chunk_end - chunk_overlap, chunk_start)
         
-        # Get last chunk_overlap characters
-        return text[-self.chunk_overlap:]
+        chunk_end = ends[i]
+    
+    # Add last chunk
+    bounds[count, 0] = chunk_start
+    bounds[count, 1] = chunk_end
+    count += 1
+    
+    return bounds[:count]
 
 
 def chunk_text(
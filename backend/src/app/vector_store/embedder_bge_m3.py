@@ -3,17 +3,22 @@ BGE-M3 Embedder
 한국어 특화 임베딩 모델 (BAAI/bge-m3)
 """
 
-from typing import List, Union
-from functools import lru_cache
+from typing import List
+from functools import cache, lru_cache
 
-from sentence_transformers import SentenceTransformer
+import numpy as np
 
 from ..config import get_settings
 from ..config.logger import get_logger
+from .embedding_cache import create_embedding_cache
 
 logger = get_logger()
 settings = get_settings()
 
+# Upper bound on characters per token (Korean ~1-2, English ~4), used to
+# truncate inputs before tokenization without changing the tokenized result
+_MAX_CHARS_PER_TOKEN = 4
+
 
 class BGEm3Embedder:
     """
@@ -30,22 +35,55 @@ class BGEm3Embedder:
         self.model_name = settings.embedding_model
         self.dimension = settings.embedding_dimension
         
+        # Exact-match LRU cache for search queries (repeated queries skip the model)
+        self._cached_query_embedding = lru_cache(
+            maxsize=settings.query_embedding_cache_size
+        )(self._embed_query_uncached)
+        
         try:
             logger.info(
                 "Loading embedding model",
                 extra={"model": self.model_name}
             )
             
+            # Imported here so importing the app (e.g. in tests) doesn't load torch
+            from sentence_transformers import SentenceTransformer
+            
+            self.device = self._resolve_device(settings.embedding_device)
+            
             self.model = SentenceTransformer(
                 self.model_name,
-                device="cpu"  # GPU 사용 시 "cuda"로 변경
+                device=self.device
+            )
+            
+            # FP16 on GPU halves memory bandwidth and uses tensor cores
+            if self.device.startswith("cuda"):
+                self.model.half()
+            
+            # Text beyond this length would be cut by the tokenizer anyway
+            self.max_chars = self.model.max_seq_length * _MAX_CHARS_PER_TOKEN
+            
+            # Shared encode options (numpy output, no tqdm setup per call)
+            self._encode_kwargs = dict(
+                normalize_embeddings=True,
+                show_progress_bar=False,
+                convert_to_numpy=True,
+                convert_to_tensor=False
+            )
+            
+            # Persistent content-hash cache for batch (ingestion) embeddings
+            self.cache = create_embedding_cache(
+                settings.embedding_cache_dir,
+                self.model_name,
+                self.dimension
             )
             
             logger.info(
                 "Embedding model loaded successfully",
                 extra={
                     "model": self.model_name,
-                    "dimension": self.dimension
+                    "dimension": self.dimension,
+                    "device": self.device
                 }
             )
             
@@ -57,7 +95,25 @@ class BGEm3Embedder:
             )
             raise
     
-    def embed_text(self, text: str) -> List[float]:
+    @staticmethod
+    def _resolve_device(device: str) -> str:
+        """
+        임베딩 디바이스 결정
+        
+        Args:
+            device: 설정값 ("auto"이면 CUDA 사용 가능 여부로 결정)
+        
+        Returns:
+            str: 디바이스 이름 ("cuda" 또는 "cpu" 등)
+        """
+        if device != "auto":
+            return device
+        
+        import torch
+        
+        return "cuda" if torch.cuda.is_available() else "cpu"
+    
+    def embed_text(self, text: str) -> np.ndarray:
         """
         단일 텍스트 임베딩
         
@@ -65,20 +121,16 @@ class BGEm3Embedder:
             text: 임베딩할 텍스트
         
         Returns:
-            List[float]: 임베딩 벡터
+            np.ndarray: (dimension,) float32 임베딩 벡터
         """
         try:
             if not text or not text.strip():
                 logger.warning("Empty text provided for embedding")
-                return [0.0] * self.dimension
+                return np.zeros(self.dimension, dtype=np.float32)
             
-            embedding = self.model.encode(
-                text,
-                normalize_embeddings=True,
-                show_progress_bar=False
-            )
+            embedding = self.model.encode(text[:self.max_chars], **self._encode_kwargs)
             
-            return embedding.tolist()
+            return embedding.astype(np.float32, copy=False)
             
         except Exception as e:
             logger.error(
@@ -88,12 +140,33 @@ class BGEm3Embedder:
             )
             raise
     
+    def embed_query(self, text: str) -> np.ndarray:
+        """
+        검색 쿼리 임베딩 (LRU 캐시 적용)
+        
+        공백 차이만 있는 쿼리는 같은 캐시 항목을 사용합니다.
+        
+        Args:
+            text: 검색 쿼리
+        
+        Returns:
+            np.ndarray: 읽기 전용 임베딩 벡터
+        """
+        key = " ".join(text.split()) if text else ""
+        return self._cached_query_embedding(key)
+    
+    def _embed_query_uncached(self, text: str) -> np.ndarray:
+        """캐시 미스 시 쿼리 임베딩 (캐시 공유를 위해 읽기 전용으로 저장)"""
+        embedding = self.embed_text(text)
+        embedding.flags.writeable = False
+        return embedding
+    
     def embed_batch(
         self, 
         texts: List[str],
         batch_size: int = 32,
         show_progress: bool = False
-    ) -> List[List[float]]:
+    ) -> np.ndarray:
         """
         배치 텍스트 임베딩
         
@@ -103,33 +176,59 @@ class BGEm3Embedder:
             show_progress: 진행률 표시 여부
         
         Returns:
-            List[List[float]]: 임베딩 벡터 리스트
+            np.ndarray: (텍스트 수, dimension) float32 임베딩 행렬
         """
         try:
             if not texts:
                 logger.warning("Empty text list provided for embedding")
-                return []
+                return np.empty((0, self.dimension), dtype=np.float32)
             
-            # Filter empty texts
-            filtered_texts = [text for text in texts if text and text.strip()]
+            # Empty texts keep zero vectors at their positions
+            embeddings = np.zeros((len(texts), self.dimension), dtype=np.float32)
+            valid_indices = [i for i, text in enumerate(texts) if text and text.strip()]
             
-            if not filtered_texts:
+            if not valid_indices:
                 logger.warning("All texts are empty after filtering")
-                return [[0.0] * self.dimension] * len(texts)
+                return embeddings
             
-            embeddings = self.model.encode(
-                filtered_texts,
-                batch_size=batch_size,
-                normalize_embeddings=True,
-                show_progress_bar=show_progress
-            )
+            # Look up cached embeddings by content hash
+            keys = {}
+            if self.cache is not None:
+                keys = {i: self.cache.make_key(texts[i]) for i in valid_indices}
+                hits = self.cache.get_many(list(set(keys.values())))
+                for i, key in keys.items():
+                    if key in hits:
+                        embeddings[i] = hits[key]
+                miss_indices = [i for i in valid_indices if keys[i] not in hits]
+            else:
+                miss_indices = valid_indices
+            
+            if miss_indices:
+                encode_kwargs = self._encode_kwargs
+                if show_progress:
+                    encode_kwargs = {**encode_kwargs, "show_progress_bar": True}
+                
+                encoded = self.model.encode(
+                    [texts[i][:self.max_chars] for i in miss_indices],
+                    batch_size=batch_size,
+                    **encode_kwargs
+                )
+                embeddings[miss_indices] = encoded
+                
+                if self.cache is not None:
+                    self.cache.set_many({
+                        keys[i]: embeddings[i] for i in miss_indices
+                    })
             
             logger.info(
                 "Batch embedding completed",
-                extra={"count": len(filtered_texts)}
+                extra={
+                    "count": len(valid_indices),
+                    "cache_hits": len(valid_indices) - len(miss_indices)
+                }
             )
             
-            return embeddings.tolist()
+            return embeddings
             
         except Exception as e:
             logger.error(
@@ -153,7 +252,7 @@ class BGEm3Embedder:
         }
 
 
-@lru_cache()
+@cache
 def get_embedder() -> BGEm3Embedder:
     """
     Get cached embedder instance
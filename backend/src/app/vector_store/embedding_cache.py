@@ -0,0 +1,177 @@
+"""
+Embedding Cache
+콘텐츠 해시 기반 디스크 임베딩 캐시 (재적재 시 재임베딩 방지)
+"""
+
+from typing import Dict, List, Optional
+from pathlib import Path
+import hashlib
+import re
+import sqlite3
+import threading
+
+import numpy as np
+
+from ..config.logger import get_logger
+
+logger = get_logger()
+
+# SQLite 바인딩 변수 개수 제한을 넘지 않도록 IN 절을 나눠서 조회
+_MAX_QUERY_PARAMS = 500
+
+# 캐시 키 정규화용 공백 패턴
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+
+
+class EmbeddingCache:
+    """
+    SQLite 기반 임베딩 캐시
+    
+    키는 sha256(모델명 + 텍스트)이며, 벡터는 float16으로 저장해 용량을 절반으로 줄입니다.
+    
+    Attributes:
+        path: 캐시 DB 파일 경로
+        model_name: 임베딩 모델 이름 (키에 포함)
+        dimension: 임베딩 차원
+    """
+    
+    def __init__(self, cache_dir: str, model_name: str, dimension: int):
+        """
+        Initialize embedding cache
+        
+        Args:
+            cache_dir: 캐시 디렉토리
+            model_name: 임베딩 모델 이름
+            dimension: 임베딩 차원
+        """
+        Path(cache_dir).mkdir(parents=True, exist_ok=True)
+        
+        self.path = str(Path(cache_dir) / "embeddings.sqlite3")
+        self.model_name = model_name
+        self.dimension = dimension
+        self._lock = threading.Lock()
+        
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings (key BLOB PRIMARY KEY, vector BLOB NOT NULL)"
+        )
+        self._conn.commit()
+        
+        logger.info(
+            "Embedding cache initialized",
+            extra={"path": self.path, "model": model_name}
+        )
+    
+    def make_key(self, text: str) -> bytes:
+        """
+        캐시 키 생성 (정규화된 텍스트 기준)
+        
+        대소문자와 공백 차이만 있는 텍스트는 같은 키를 가집니다.
+        
+        Args:
+            text: 임베딩할 텍스트
+        
+        Returns:
+            bytes: sha256 digest
+        """
+        normalized = normalize_text(text)
+        return hashlib.sha256(f"{self.model_name}\0{normalized}".encode("utf-8")).digest()
+    
+    def get_many(self, keys: List[bytes]) -> Dict[bytes, np.ndarray]:
+        """
+        여러 키의 벡터 조회
+        
+        Args:
+            keys: 캐시 키 리스트
+        
+        Returns:
+            Dict[bytes, np.ndarray]: 히트된 키 → float32 벡터
+        """
+        hits = {}
+        
+        with self._lock:
+            for i in range(0, len(keys), _MAX_QUERY_PARAMS):
+                batch = keys[i:i + _MAX_QUERY_PARAMS]
+                placeholders = ",".join("?" * len(batch))
+                rows = self._conn.execute(
+                    f"SELECT key, vector FROM embeddings WHERE key IN ({placeholders})",
+                    batch
+                ).fetchall()
+                
+                for key, blob in rows:
+                    vector = np.frombuffer(blob, dtype=np.float16)
+                    if vector.shape[0] == self.dimension:
+                        hits[key] = vector.astype(np.float32)
+        
+        return hits
+    
+    def set_many(self, items: Dict[bytes, np.ndarray]) -> None:
+        """
+        여러 벡터 저장
+        
+        Args:
+            items: 캐시 키 → 벡터
+        """
+        if not items:
+            return
+        
+        rows = [
+            (key, np.asarray(vector, dtype=np.float16).tobytes())
+            for key, vector in items.items()
+        ]
+        
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO embeddings (key, vector) VALUES (?, ?)",
+                rows
+            )
+            self._conn.commit()
+    
+    def close(self) -> None:
+        """캐시 DB 연결 종료"""
+        with self._lock:
+            self._conn.close()
+
+
+def normalize_text(text: str) -> str:
+    """
+    캐시 키용 텍스트 정규화 (소문자, 공백 압축)
+    
+    구두점은 의미를 바꿀 수 있으므로("3.5%" vs "35") 유지합니다.
+    
+    Args:
+        text: 원본 텍스트
+    
+    Returns:
+        str: 정규화된 텍스트
+    """
+    return _WHITESPACE_PATTERN.sub(" ", text.lower()).strip()
+
+
+def create_embedding_cache(
+    cache_dir: Optional[str],
+    model_name: str,
+    dimension: int
+) -> Optional[EmbeddingCache]:
+    """
+    임베딩 캐시 생성 헬퍼 함수
+    
+    Args:
+        cache_dir: 캐시 디렉토리 (없으면 캐시 비활성화)
+        model_name: 임베딩 모델 이름
+        dimension: 임베딩 차원
+    
+    Returns:
+        Optional[EmbeddingCache]: 캐시 인스턴스 (비활성화 또는 실패 시 None)
+    """
+    if not cache_dir:
+        return None
+    
+    try:
+        return EmbeddingCache(cache_dir, model_name, dimension)
+    except Exception as e:
+        logger.warning(
+            "Failed to initialize embedding cache, continuing without it",
+            extra={"cache_dir": cache_dir, "error": str(e)}
+        )
+        return None
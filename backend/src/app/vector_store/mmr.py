@@ -0,0 +1,58 @@
+"""
+MMR (Maximal Marginal Relevance)
+검색 결과 다양화 (유사한 결과 중복 완화)
+"""
+
+from typing import List, Sequence, Union
+
+import numpy as np
+
+
+def mmr_select(
+    scores: Sequence[float],
+    vectors: Sequence[Union[List[float], np.ndarray]],
+    k: int,
+    lambda_mult: float = 0.7
+) -> List[int]:
+    """
+    MMR 기반 결과 선택
+    
+    관련도(검색 스코어)와 이미 선택된 결과와의 최대 코사인 유사도를 절충해
+    k개의 인덱스를 순서대로 선택합니다. 벡터는 정규화되어 있다고 가정합니다.
+    
+    Args:
+        scores: 후보별 관련도 스코어
+        vectors: 후보별 임베딩 벡터 (정규화됨)
+        k: 선택할 개수
+        lambda_mult: 관련도 가중치 (1.0이면 스코어 순서와 동일)
+    
+    Returns:
+        List[int]: 선택된 후보 인덱스 (선택 순서)
+    """
+    n = len(scores)
+    k = min(k, n)
+    if k <= 0:
+        return []
+    
+    relevance = lambda_mult * np.asarray(scores, dtype=np.float32)
+    matrix = np.asarray(vectors, dtype=np.float32)
+    
+    # Pairwise cosine similarity in a single BLAS call
+    similarity = matrix @ matrix.T
+    
+    first = int(np.argmax(relevance))
+    selected = [first]
+    chosen = np.zeros(n, dtype=bool)
+    chosen[first] = True
+    max_similarity = similarity[first].copy()
+    
+    while len(selected) < k:
+        mmr_scores = relevance - (1.0 - lambda_mult) * max_similarity
+        mmr_scores[chosen] = -np.inf
+        
+        index = int(np.argmax(mmr_scores))
+        selected.append(index)
+        chosen[index] = True
+        np.maximum(max_similarity, similarity[index], out=max_similarity)
+    
+    return selected
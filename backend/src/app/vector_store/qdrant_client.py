@@ -3,26 +3,56 @@ Qdrant 클라이언트
 벡터 DB 연결 및 관리
 """
 
-from typing import List, Dict, Any, Optional
-from functools import lru_cache
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Tuple, Union
+from functools import cache, lru_cache
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 
+import numpy as np
 from qdrant_client import QdrantClient
 from qdrant_client.models import (
     VectorParams,
     Distance,
     PointStruct,
+    Batch,
     Filter,
     FieldCondition,
     MatchValue,
     SearchRequest,
+    ScalarQuantization,
+    ScalarQuantizationConfig,
+    ScalarType,
+    BinaryQuantization,
+    BinaryQuantizationConfig,
+    SearchParams,
+    QuantizationSearchParams,
+    HnswConfigDiff,
+    OptimizersConfigDiff,
 )
 
 from ..config import get_settings
 from ..config.logger import get_logger
+from .query_cache import QueryCache
 
 logger = get_logger()
 settings = get_settings()
 
+# Upsert chunk size and number of concurrent in-flight chunks
+_UPSERT_BATCH_SIZE = 128
+_UPSERT_PARALLELISM = 2
+
+# HNSW search width, and quantized candidates are rescored with the
+# original vectors (2x oversampling)
+_SEARCH_PARAMS = SearchParams(
+    hnsw_ef=settings.qdrant_hnsw_ef,
+    quantization=QuantizationSearchParams(
+        ignore=False,
+        rescore=True,
+        oversampling=2.0
+    )
+)
+
 
 class QdrantManager:
     """
@@ -39,15 +69,28 @@ class QdrantManager:
             self.client = QdrantClient(
                 url=settings.qdrant_url,
                 api_key=settings.qdrant_api_key,
+                prefer_grpc=settings.qdrant_prefer_grpc,
+                grpc_port=settings.qdrant_grpc_port,
                 timeout=60
             )
             self.collection_name = settings.qdrant_collection
             
+            # Semantic cache for repeated / near-duplicate queries
+            self.query_cache = None
+            if settings.qdrant_query_cache_size > 0:
+                self.query_cache = QueryCache(
+                    dimension=settings.embedding_dimension,
+                    max_entries=settings.qdrant_query_cache_size,
+                    ttl=settings.qdrant_query_cache_ttl,
+                    similarity_threshold=settings.qdrant_query_cache_threshold
+                )
+            
             logger.info(
                 "Qdrant client initialized",
                 extra={
                     "url": settings.qdrant_url,
-                    "collection": self.collection_name
+                    "collection": self.collection_name,
+                    "grpc": settings.qdrant_prefer_grpc
                 }
             )
         except Exception as e:
@@ -62,7 +105,8 @@ class QdrantManager:
         self,
         vector_size: int = 1024,
         distance: Distance = Distance.COSINE,
-        force_recreate: bool = False
+        force_recreate: bool = False,
+        quantization: Optional[str] = None
     ) -> bool:
         """
         컬렉션 생성
@@ -71,18 +115,13 @@ class QdrantManager:
             vector_size: 벡터 차원 (bge-m3는 1024)
             distance: 거리 메트릭 (COSINE, EUCLID, DOT)
             force_recreate: 기존 컬렉션 삭제 후 재생성
+            quantization: 양자화 방식 ("none", "scalar", "binary", 기본값은 설정값)
         
         Returns:
             bool: 성공 여부
         """
         try:
-            # Check if collection exists
-            collections = self.client.get_collections().collections
-            collection_exists = any(
-                col.name == self.collection_name for col in collections
-            )
-            
-            if collection_exists:
+            if self._collection_exists():
                 if force_recreate:
                     logger.warning(
                         "Deleting existing collection",
@@ -96,21 +135,35 @@ class QdrantManager:
                     )
                     return True
             
+            quantization = quantization or settings.qdrant_quantization
+            quantization_config = self._build_quantization_config(quantization)
+            
             # Create collection
             self.client.create_collection(
                 collection_name=self.collection_name,
                 vectors_config=VectorParams(
                     size=vector_size,
                     distance=distance
-                )
+                ),
+                hnsw_config=HnswConfigDiff(
+                    m=settings.qdrant_hnsw_m,
+                    ef_construct=settings.qdrant_hnsw_ef_construct,
+                    full_scan_threshold=settings.qdrant_full_scan_threshold
+                ),
+                optimizers_config=OptimizersConfigDiff(
+                    indexing_threshold=settings.qdrant_indexing_threshold
+                ),
+                quantization_config=quantization_config
             )
+            self._invalidate_cache()
             
             logger.info(
                 "Collection created successfully",
                 extra={
                     "collection": self.collection_name,
                     "vector_size": vector_size,
-                    "distance": distance
+                    "distance": distance,
+                    "quantization": quantization
                 }
             )
             
@@ -124,32 +177,134 @@ class QdrantManager:
             )
             raise
     
+    def _collection_exists(self) -> bool:
+        """
+        컬렉션 존재 여부 확인
+        
+        qdrant-client 1.8+의 collection_exists를 사용하고,
+        이전 버전에서는 전체 컬렉션 목록에서 찾습니다.
+        
+        Returns:
+            bool: 존재 여부
+        """
+        if hasattr(self.client, "collection_exists"):
+            return self.client.collection_exists(self.collection_name)
+        
+        collections = self.client.get_collections().collections
+        return any(col.name == self.collection_name for col in collections)
+    
+    @staticmethod
+    def _build_quantization_config(
+        quantization: str
+    ) -> Optional[Union[ScalarQuantization, BinaryQuantization]]:
+        """
+        양자화 설정 생성 (양자화 벡터는 RAM에 유지, 원본 벡터는 재채점에 사용)
+        
+        Args:
+            quantization: 양자화 방식 ("none", "scalar", "binary")
+        
+        Returns:
+            Optional[Union[ScalarQuantization, BinaryQuantization]]: 양자화 설정 ("none"이면 None)
+        """
+        if quantization == "none":
+            return None
+        
+        if quantization == "scalar":
+            return ScalarQuantization(
+                scalar=ScalarQuantizationConfig(
+                    type=ScalarType.INT8,
+                    always_ram=True
+                )
+            )
+        
+        if quantization == "binary":
+            return BinaryQuantization(
+                binary=BinaryQuantizationConfig(always_ram=True)
+            )
+        
+        raise ValueError(f"Unsupported quantization: {quantization}")
+    
     def upsert_points(
         self,
-        points: List[PointStruct]
+        points: Iterable[PointStruct]
     ) -> bool:
         """
         포인트 업서트 (생성 또는 업데이트)
         
+        제너레이터도 받을 수 있으며, 청크 단위로 읽어 전송하므로
+        전체 포인트를 메모리에 올리지 않습니다.
+        
         Args:
-            points: 포인트 리스트
+            points: 포인트 리스트 또는 이터러블
         
         Returns:
             bool: 성공 여부
         """
         try:
-            if not points:
+            iterator = iter(points)
+            chunks = iter(lambda: list(islice(iterator, _UPSERT_BATCH_SIZE)), [])
+            
+            count = self._upsert_chunked(chunks)
+            if count == 0:
                 logger.warning("No points to upsert")
                 return False
             
-            self.client.upsert(
-                collection_name=self.collection_name,
-                points=points
+            self._invalidate_cache()
+            
+            logger.info(
+                "Points upserted successfully",
+                extra={"count": count}
             )
             
+            return True
+            
+        except Exception as e:
+            logger.error(
+                "Error upserting points",
+                extra={"error": str(e)},
+                exc_info=True
+            )
+            raise
+    
+    def upsert_vectors(
+        self,
+        ids: List[int],
+        vectors: Union[List[List[float]], np.ndarray],
+        payloads: List[Dict[str, Any]]
+    ) -> bool:
+        """
+        임베딩 행렬을 배치로 업서트
+        
+        포인트별 PointStruct 대신 float32 행렬을 한 번에 변환해 단일 Batch로 전송합니다.
+        
+        Args:
+            ids: 포인트 ID 리스트
+            vectors: (포인트 수, dimension) 임베딩 행렬
+            payloads: 포인트별 페이로드
+        
+        Returns:
+            bool: 성공 여부
+        """
+        try:
+            if not ids:
+                logger.warning("No points to upsert")
+                return False
+            
+            vectors = np.ascontiguousarray(vectors, dtype=np.float32)
+            
+            self._upsert_chunked(
+                Batch(
+                    ids=ids[i:i + _UPSERT_BATCH_SIZE],
+                    vectors=vectors[i:i + _UPSERT_BATCH_SIZE].tolist(),
+                    payloads=payloads[i:i + _UPSERT_BATCH_SIZE]
+                )
+                for i in range(0, len(ids), _UPSERT_BATCH_SIZE)
+            )
+            self._invalidate_cache()
+            
             logger.info(
                 "Points upserted successfully",
-                extra={"count": len(points)}
+                extra={"count": len(ids)}
             )
             
             return True
@@ -162,12 +317,67 @@ class QdrantManager:
             )
             raise
     
+    def _upsert_chunked(self, chunks: Iterator[Union[List[PointStruct], Batch]]) -> int:
+        """
+        청크 단위 업서트
+        
+        마지막 청크를 제외한 청크는 wait=False로 최대 _UPSERT_PARALLELISM개까지
+        동시에 전송하고, 모두 접수된 뒤 마지막 청크를 wait=True로 전송해
+        이전 청크까지 반영될 때까지 대기합니다. 청크는 필요할 때만 읽습니다.
+        
+        Args:
+            chunks: 포인트 리스트 또는 Batch 청크 이터레이터
+        
+        Returns:
+            int: 업서트된 포인트 수
+        """
+        chunks = iter(chunks)
+        chunk = next(chunks, None)
+        if chunk is None:
+            return 0
+        
+        count = 0
+        in_flight = deque()
+        
+        with ThreadPoolExecutor(max_workers=_UPSERT_PARALLELISM) as executor:
+            # Look one chunk ahead so the last chunk can be sent with wait=True
+            for next_chunk in chunks:
+                if len(in_flight) >= _UPSERT_PARALLELISM:
+                    in_flight.popleft().result()
+                
+                in_flight.append(executor.submit(
+                    self.client.upsert,
+                    collection_name=self.collection_name,
+                    points=chunk,
+                    wait=False
+                ))
+                count += self._chunk_size(chunk)
+                chunk = next_chunk
+            
+            for future in in_flight:
+                future.result()
+        
+        self.client.upsert(
+            collection_name=self.collection_name,
+            points=chunk,
+            wait=True
+        )
+        
+        return count + self._chunk_size(chunk)
+    
+    @staticmethod
+    def _chunk_size(chunk: Union[List[PointStruct], Batch]) -> int:
+        """청크의 포인트 수"""
+        return len(chunk.ids) if isinstance(chunk, Batch) else len(chunk)
+    
     def search(
         self,
-        query_vector: List[float],
+        query_vector: Union[List[float], np.ndarray],
         limit: int = 5,
         score_threshold: Optional[float] = None,
-        filter_dict: Optional[Dict[str, Any]] = None
+        filter_dict: Optional[Dict[str, Any]] = None,
+        with_vectors: bool = False,
+        with_payload: Union[bool, List[str]] = False
     ) -> List[Dict[str, Any]]:
         """
         벡터 검색
@@ -177,47 +387,99 @@ class QdrantManager:
             limit: 반환 개수
             score_threshold: 최소 스코어 (선택)
             filter_dict: 필터 조건 (선택) 예: {"policy_id": 1}
+            with_vectors: 결과에 저장된 벡터 포함 여부 ("vector" 키)
+            with_payload: 반환할 페이로드 (True: 전체, 필드 리스트: 해당 필드만, False: 없음)
         
         Returns:
             List[Dict]: 검색 결과 리스트
         """
+        cache_key = None
+        if self.query_cache is not None:
+            cache_key = self._cache_key(
+                limit, score_threshold, filter_dict, with_vectors, with_payload
+            )
+            if cache_key is not None:
+                cached = self.query_cache.get(query_vector, cache_key)
+                if cached is not None:
+                    logger.debug("Search cache hit", extra={"results_count": len(cached)})
+                    return cached
+        
+        results = self.search_batch(
+            query_vectors=[query_vector],
+            limit=limit,
+            score_threshold=score_threshold,
+            filter_dict=filter_dict,
+            with_vectors=with_vectors,
+            with_payload=with_payload
+        )[0]
+        
+        if cache_key is not None:
+            self.query_cache.put(query_vector, cache_key, results)
+        
+        return results
+    
+    def search_batch(
+        self,
+        query_vectors: List[Union[List[float], np.ndarray]],
+        limit: int = 5,
+        score_threshold: Optional[float] = None,
+        filter_dict: Optional[Dict[str, Any]] = None,
+        with_vectors: bool = False,
+        with_payload: Union[bool, List[str]] = False
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        여러 쿼리 벡터를 한 번의 요청으로 검색
+        
+        단일 검색(search)도 이 메서드를 통해 수행됩니다.
+        
+        Args:
+            query_vectors: 쿼리 벡터 리스트
+            limit: 쿼리별 반환 개수
+            score_threshold: 최소 스코어 (선택)
+            filter_dict: 모든 쿼리에 공통 적용할 필터 조건 (선택)
+            with_vectors: 결과에 저장된 벡터 포함 여부 ("vector" 키)
+            with_payload: 반환할 페이로드 (True: 전체, 필드 리스트: 해당 필드만, False: 없음)
+        
+        Returns:
+            List[List[Dict]]: 쿼리 순서대로 정렬된 검색 결과 리스트
+        """
         try:
-            # Build filter
-            query_filter = None
-            if filter_dict:
-                conditions = [
-                    FieldCondition(
-                        key=key,
-                        match=MatchValue(value=value)
-                    )
-                    for key, value in filter_dict.items()
-                ]
-                query_filter = Filter(must=conditions)
+            if not query_vectors:
+                return []
             
-            # Search
-            results = self.client.search(
+            # One contiguous float32 conversion per query (tolist runs in C)
+            query_filter = self._build_filter(filter_dict)
+            requests = [
+                SearchRequest(
+                    vector=np.ascontiguousarray(vector, dtype=np.float32).tolist(),
+                    filter=query_filter,
+                    limit=limit,
+                    score_threshold=score_threshold,
+                    with_payload=with_payload,
+                    with_vector=with_vectors,
+                    params=_SEARCH_PARAMS
+                )
+                for vector in query_vectors
+            ]
+            
+            batch_results = self.client.search_batch(
                 collection_name=self.collection_name,
-                query_vector=query_vector,
-                limit=limit,
-                score_threshold=score_threshold,
-                query_filter=query_filter
+                requests=requests
             )
             
-            # Format results
-            formatted_results = []
-            for result in results:
-                formatted_results.append({
-                    "id": result.id,
-                    "score": result.score,
-                    "payload": result.payload
-                })
+            formatted_batch = [
+                self._format_results(results, with_vectors) for results in batch_results
+            ]
             
             logger.debug(
                 "Search completed",
-                extra={"results_count": len(formatted_results)}
+                extra={
+                    "queries_count": len(formatted_batch),
+                    "results_count": sum(len(results) for results in formatted_batch)
+                }
             )
             
-            return formatted_results
+            return formatted_batch
             
         except Exception as e:
             logger.error(
@@ -227,6 +489,86 @@ class QdrantManager:
             )
             raise
     
+    @staticmethod
+    def _cache_key(
+        limit: int,
+        score_threshold: Optional[float],
+        filter_dict: Optional[Dict[str, Any]],
+        with_vectors: bool,
+        with_payload: Union[bool, List[str]]
+    ) -> Optional[Tuple]:
+        """
+        검색 조건으로 캐시 키 생성
+        
+        Returns:
+            Optional[Tuple]: 캐시 키 (필터 값이 해시 불가능하면 None)
+        """
+        key = (
+            limit,
+            score_threshold,
+            tuple(sorted(filter_dict.items())) if filter_dict else (),
+            with_vectors,
+            tuple(with_payload) if isinstance(with_payload, list) else with_payload
+        )
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+    
+    def _invalidate_cache(self) -> None:
+        """컬렉션 데이터 변경 시 검색 캐시 초기화"""
+        if self.query_cache is not None:
+            self.query_cache.clear()
+    
+    @staticmethod
+    def _build_filter(filter_dict: Optional[Dict[str, Any]]) -> Optional[Filter]:
+        """
+        필터 조건 딕셔너리를 Qdrant Filter로 변환
+        
+        Args:
+            filter_dict: 필터 조건 예: {"policy_id": 1}
+        
+        Returns:
+            Optional[Filter]: Qdrant 필터 (조건이 없으면 None)
+        """
+        if not filter_dict:
+            return None
+        
+        try:
+            return _build_filter_cached(tuple(sorted(filter_dict.items())))
+        except TypeError:
+            # Unhashable filter values can't be cached
+            return _build_filter_uncached(filter_dict.items())
+    
+    @staticmethod
+    def _format_results(results, with_vectors: bool = False) -> List[Dict[str, Any]]:
+        """
+        Qdrant ScoredPoint 리스트를 딕셔너리 리스트로 변환
+        
+        Args:
+            results: Qdrant 검색 결과
+            with_vectors: "vector" 키 포함 여부
+        
+        Returns:
+            List[Dict]: id, score, payload (및 vector)를 담은 결과 리스트
+        """
+        if with_vectors:
+            return [
+                {
+                    "id": result.id,
+                    "score": result.score,
+                    "payload": result.payload or {},
+                    "vector": result.vector
+                }
+                for result in results
+            ]
+        
+        return [
+            {"id": result.id, "score": result.score, "payload": result.payload or {}}
+            for result in results
+        ]
+    
     def delete_points(
         self,
         point_ids: List[int]
@@ -248,6 +590,7 @@ class QdrantManager:
                 collection_name=self.collection_name,
                 points_selector=point_ids
             )
+            self._invalidate_cache()
             
             logger.info(
                 "Points deleted successfully",
@@ -274,7 +617,7 @@ class QdrantManager:
         try:
             info = self.client.get_collection(self.collection_name)
             return {
-                "name": info.name,
+                "name": self.collection_name,
                 "vectors_count": info.vectors_count,
                 "points_count": info.points_count,
                 "status": info.status
@@ -288,7 +631,25 @@ class QdrantManager:
             raise
 
 
-@lru_cache()
+def _build_filter_uncached(filter_items) -> Filter:
+    """(key, value) 쌍으로 must 조건 Filter 생성"""
+    conditions = [
+        FieldCondition(
+            key=key,
+            match=MatchValue(value=value)
+        )
+        for key, value in filter_items
+    ]
+    return Filter(must=conditions)
+
+
+@lru_cache(maxsize=256)
+def _build_filter_cached(filter_items: Tuple[Tuple[str, Any], ...]) -> Filter:
+    """반복되는 필터 조건의 Filter 객체 재사용 (클라이언트는 Filter를 변경하지 않음)"""
+    return _build_filter_uncached(filter_items)
+
+
+@cache
 def get_qdrant_manager() -> QdrantManager:
     """
     Get cached Qdrant manager instance
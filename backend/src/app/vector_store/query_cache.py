@@ -0,0 +1,158 @@
+"""
+Query Cache
+쿼리 임베딩 유사도 기반 검색 결과 캐시 (Semantic LRU Cache)
+"""
+
+from collections import OrderedDict
+import copy
+from typing import Any, Dict, Hashable, List, Optional, Tuple, Union
+import threading
+import time
+
+import numpy as np
+
+
+class QueryCache:
+    """
+    시맨틱 검색 결과 캐시
+    
+    저장된 쿼리 벡터와의 코사인 유사도가 임계값 이상이고 검색 조건(params_key)이
+    같으면 캐시된 결과를 반환합니다. 항목은 TTL 이후 만료되며 LRU 순서로 제거됩니다.
+    결과는 저장/조회 시 복사되므로 호출자가 수정해도 캐시에 영향이 없습니다.
+    
+    Attributes:
+        max_entries: 최대 항목 수
+        ttl: 항목 유효 시간 (초)
+        similarity_threshold: 캐시 히트 최소 코사인 유사도
+    """
+    
+    def __init__(
+        self,
+        dimension: int,
+        max_entries: int = 1000,
+        ttl: float = 300.0,
+        similarity_threshold: float = 0.97
+    ):
+        """
+        Initialize query cache
+        
+        Args:
+            dimension: 쿼리 벡터 차원
+            max_entries: 최대 항목 수
+            ttl: 항목 유효 시간 (초)
+            similarity_threshold: 캐시 히트 최소 코사인 유사도
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.similarity_threshold = similarity_threshold
+        
+        # Normalized query vectors, one row per slot (inactive rows are ignored)
+        self._vectors = np.zeros((max_entries, dimension), dtype=np.float32)
+        self._active = np.zeros(max_entries, dtype=bool)
+        
+        # slot -> (params_key, expires_at, results), ordered from least recently used
+        self._entries: "OrderedDict[int, Tuple[Hashable, float, List[Dict[str, Any]]]]" = OrderedDict()
+        self._free_slots = list(range(max_entries - 1, -1, -1))
+        self._lock = threading.Lock()
+    
+    def get(
+        self,
+        query_vector: Union[List[float], np.ndarray],
+        params_key: Hashable
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        유사한 쿼리의 캐시된 결과 조회
+        
+        Args:
+            query_vector: 쿼리 벡터
+            params_key: 검색 조건 키 (limit, 필터 등)
+        
+        Returns:
+            Optional[List[Dict]]: 캐시된 검색 결과의 복사본 (미스 시 None)
+        """
+        query = self._normalize(query_vector)
+        if query is None:
+            return None
+        
+        now = time.monotonic()
+        
+        with self._lock:
+            if not self._entries:
+                return None
+            
+            similarities = self._vectors @ query
+            candidates = np.flatnonzero(
+                self._active & (similarities >= self.similarity_threshold)
+            )
+            
+            # Most similar first
+            for slot in candidates[np.argsort(-similarities[candidates])].tolist():
+                entry_key, expires_at, results = self._entries[slot]
+                
+                if expires_at <= now:
+                    self._release(slot)
+                    continue
+                
+                if entry_key == params_key:
+                    self._entries.move_to_end(slot)
+                    break
+            else:
+                return None
+        
+        return copy.deepcopy(results)
+    
+    def put(
+        self,
+        query_vector: Union[List[float], np.ndarray],
+        params_key: Hashable,
+        results: List[Dict[str, Any]]
+    ) -> None:
+        """
+        검색 결과 저장
+        
+        Args:
+            query_vector: 쿼리 벡터
+            params_key: 검색 조건 키 (limit, 필터 등)
+            results: 검색 결과
+        """
+        query = self._normalize(query_vector)
+        if query is None:
+            return
+        
+        results = copy.deepcopy(results)
+        
+        with self._lock:
+            if self._free_slots:
+                slot = self._free_slots.pop()
+            else:
+                # Evict the least recently used entry
+                slot, _ = self._entries.popitem(last=False)
+            
+            self._vectors[slot] = query
+            self._active[slot] = True
+            self._entries[slot] = (params_key, time.monotonic() + self.ttl, results)
+    
+    def clear(self) -> None:
+        """모든 항목 제거 (컬렉션 변경 시 호출)"""
+        with self._lock:
+            self._entries.clear()
+            self._active[:] = False
+            self._free_slots = list(range(self.max_entries - 1, -1, -1))
+    
+    def _release(self, slot: int) -> None:
+        """만료된 슬롯 반환 (lock 보유 상태에서 호출)"""
+        del self._entries[slot]
+        self._active[slot] = False
+        self._free_slots.append(slot)
+    
+    def _normalize(self, query_vector: Union[List[float], np.ndarray]) -> Optional[np.ndarray]:
+        """코사인 비교를 위한 단위 벡터 변환 (영벡터 또는 차원 불일치 시 None)"""
+        query = np.asarray(query_vector, dtype=np.float32)
+        if query.shape != self._vectors.shape[1:]:
+            return None
+        
+        norm = float(np.linalg.norm(query))
+        if norm == 0.0:
+            return None
+        
+        return query / norm
@@ -3,7 +3,15 @@ Tavily Web Search Client
 Tavily API를 사용한 웹 검색 클라이언트
 """
 
+import contextvars
+import copy
+import hashlib
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache
 from typing import List, Dict, Any, Optional
+from cachetools import TTLCache
 from tavily import TavilyClient
 
 from ...config import get_settings
@@ -30,6 +38,16 @@ class TavilySearchClient:
             api_key: Tavily API 키 (없으면 settings에서 가져옴)
         """
         self.api_key = api_key or settings.tavily_api_key
+        
+        # Query → results TTL cache (identical searches skip the network)
+        self._cache = TTLCache(
+            maxsize=settings.web_search_cache_size,
+            ttl=settings.web_search_cache_ttl
+        )
+        self._cache_lock = threading.Lock()
+        self._cache_hits = 0
+        self._cache_misses = 0
+        
         if not self.api_key:
             logger.warning("Tavily API key not configured")
             self.client = None
@@ -67,6 +85,27 @@ class TavilySearchClient:
             logger.error("Tavily client not initialized")
             return []
         
+        cache_key = self._cache_key(
+            query=query,
+            max_results=max_results,
+            search_depth=search_depth,
+            include_domains=include_domains,
+            exclude_domains=exclude_domains
+        )
+        with self._cache_lock:
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                self._cache_hits += 1
+            else:
+                self._cache_misses += 1
+        
+        if cached is not None:
+            logger.info(
+                "Tavily search cache hit",
+                extra={"query": query, "results_count": len(cached)}
+            )
+            return copy.deepcopy(cached)
+        
         try:
             logger.info(
                 "Executing Tavily search",
@@ -116,7 +155,11 @@ class TavilySearchClient:
                 }
             )
             
-            return results
+            # Failed searches return [] below and are not cached
+            with self._cache_lock:
+                self._cache[cache_key] = results
+            
+            return copy.deepcopy(results)
             
         except Exception as e:
             logger.error(
@@ -126,6 +169,63 @@ class TavilySearchClient:
             )
             return []
     
+    def search_many(
+        self,
+        queries: List[str],
+        **kwargs: Any
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        여러 쿼리를 병렬로 검색 (총 지연시간 = 가장 느린 호출)
+        
+        Args:
+            queries: 검색 쿼리 리스트
+            **kwargs: search()에 전달할 옵션 (max_results, search_depth 등)
+        
+        Returns:
+            List[List[Dict]]: 쿼리 순서대로 정렬된 검색 결과 리스트
+        """
+        if not queries:
+            return []
+        
+        with ThreadPoolExecutor(max_workers=min(8, len(queries))) as executor:
+            # Each worker runs in a copy of the caller's context so tracing parents carry over
+            futures = [
+                executor.submit(contextvars.copy_context().run, self.search, q, **kwargs)
+                for q in queries
+            ]
+            return [future.result() for future in futures]
+    
+    @staticmethod
+    def _cache_key(**params: Any) -> bytes:
+        """
+        검색 파라미터로 캐시 키 생성
+        
+        Args:
+            **params: 검색 파라미터
+        
+        Returns:
+            bytes: blake2b digest
+        """
+        return hashlib.blake2b(
+            json.dumps(params, sort_keys=True, ensure_ascii=False).encode("utf-8")
+        ).digest()
+    
+    def cache_info(self) -> Dict[str, Any]:
+        """
+        검색 결과 캐시 통계
+        
+        Returns:
+            Dict: hits, misses, size, maxsize, ttl
+        """
+        with self._cache_lock:
+            return {
+                "hits": self._cache_hits,
+                "misses": self._cache_misses,
+                "size": len(self._cache),
+                "maxsize": self._cache.maxsize,
+                "ttl": self._cache.ttl
+            }
+    
     @trace_tool(name="tavily_qna_search", tags=["web_search", "tavily", "qna"])
     def qna_search(self, query: str) -> Optional[str]:
         """
@@ -162,10 +262,7 @@ class TavilySearchClient:
             return None
 
 
-# Singleton instance
-_tavily_client: Optional[TavilySearchClient] = None
-
-
+@cache
 def get_tavily_client() -> TavilySearchClient:
     """
     Get Tavily client singleton
@@ -173,10 +270,4 @@ def get_tavily_client() -> TavilySearchClient:
     Returns:
         TavilySearchClient: Tavily 클라이언트 인스턴스
     """
-    global _tavily_client
-    
-    if _tavily_client is None:
-        _tavily_client = TavilySearchClient()
-    
-    return _tavily_client
-
+    return TavilySearchClient()
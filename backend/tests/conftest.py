@@ -3,50 +3,97 @@ Pytest Configuration
 테스트 설정 및 픽스처
 """
 
+import os
+
+# 테스트에서는 앱 시작 시 임베딩 모델을 로드하지 않음 (앱 import 전에 설정)
+os.environ.setdefault("EMBEDDER_WARMUP", "false")
+
 import pytest
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
 from fastapi.testclient import TestClient
 
 from src.app.main import app
-from src.app.db.engine import get_db
+from src.app.db.engine import get_db, get_db_session
 from src.app.db.models import Base
 
 
-# Test database URL (use in-memory SQLite for testing)
-TEST_DATABASE_URL = "sqlite:///:memory:"
+# Test database URL (shared-cache in-memory SQLite for testing)
+TEST_DATABASE_URL = "sqlite:///file::memory:?cache=shared&uri=true"
 
 
-@pytest.fixture(scope="function")
-def test_db():
+@pytest.fixture(scope="session")
+def test_engine():
     """
-    Create test database
-    각 테스트마다 새로운 DB 생성
+    Create test engine
+    테스트 세션 전체에서 한 번만 엔진과 테이블 생성
     """
+    # StaticPool: 모든 체크아웃이 같은 연결(같은 인메모리 DB)을 사용
     engine = create_engine(
         TEST_DATABASE_URL,
+        poolclass=StaticPool,
         connect_args={"check_same_thread": False}
     )
     
+    # pysqlite의 자체 트랜잭션 처리를 끄고 BEGIN을 직접 실행해야 SAVEPOINT가 동작
+    @event.listens_for(engine, "connect")
+    def do_connect(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+    
+    @event.listens_for(engine, "begin")
+    def do_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+    
     # Create tables
     Base.metadata.create_all(bind=engine)
     
-    # Create session
-    TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-    db = TestingSessionLocal()
+    try:
+        yield engine
+    finally:
+        Base.metadata.drop_all(bind=engine)
+        engine.dispose()
+
+
+@pytest.fixture(scope="function")
+def test_db(test_engine):
+    """
+    Create test database session
+    각 테스트를 외부 트랜잭션 안에서 실행하고 종료 시 롤백
+    (테스트 코드의 commit은 SAVEPOINT로 처리됨)
+    """
+    connection = test_engine.connect()
+    transaction = connection.begin()
+    
+    db = Session(
+        bind=connection,
+        autoflush=False,
+        join_transaction_mode="create_savepoint"
+    )
     
     try:
         yield db
     finally:
         db.close()
-        Base.metadata.drop_all(bind=engine)
+        transaction.rollback()
+        connection.close()
 
 
-@pytest.fixture(scope="function")
-def client(test_db):
+@pytest.fixture(scope="module")
+def app_client():
     """
     Create test client
-    FastAPI 테스트 클라이언트 생성
+    모듈당 한 번만 TestClient를 생성해 앱 lifespan 시작 비용을 공유
+    """
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture(scope="function")
+def client(app_client, test_db):
+    """
+    FastAPI 테스트 클라이언트
+    테스트마다 DB 의존성을 해당 테스트의 세션으로 교체
     """
     def override_get_db():
         try:
@@ -55,11 +102,12 @@ def client(test_db):
             pass
     
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_db_session] = override_get_db
     
-    with TestClient(app) as test_client:
-        yield test_client
-    
-    app.dependency_overrides.clear()
+    try:
+        yield app_client
+    finally:
+        app.dependency_overrides.clear()
 
 
 @pytest.fixture
@@ -46,6 +46,21 @@ def test_chat_endpoint_mock(client: TestClient, sample_chat_request):
         assert "answer" in data
 
 
+def test_chat_stream_endpoint_mock(client: TestClient, sample_chat_request):
+    """채팅 스트리밍 엔드포인트 테스트 (Mock)"""
+    async def mock_stream(**kwargs):
+        yield {"type": "token", "content": "테스트 "}
+        yield {"type": "token", "content": "답변입니다."}
+        yield {"type": "done", "session_id": kwargs["session_id"], "evidence": []}
+    
+    with patch("src.app.agent.controller.AgentController.stream_qa", side_effect=mock_stream):
+        response = client.post("/api/v1/chat/stream", json=sample_chat_request)
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        assert "data: 테스트 \n\n" in response.text
+        assert "event: done" in response.text
+
+
 def test_session_reset(client: TestClient):
     """세션 리셋 테스트"""
     response = client.post("/api/v1/session/reset", json={"session_id": "test-session-001"})
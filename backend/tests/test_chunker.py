@@ -0,0 +1,80 @@
+"""
+Text Chunker Tests
+텍스트 청킹 테스트
+"""
+
+import numpy as np
+import pytest
+
+from src.app.vector_store.chunker import TextChunker, _pack_chunks, chunk_text
+
+
+SENTENCES = "첫 번째 문장입니다. 두 번째 문장입니다. 세 번째 문장입니다! 네 번째 문장인가요?"
+
+
+@pytest.mark.parametrize("text", ["", "   ", "\n\t "])
+def test_split_text_empty_input(text):
+    """빈 입력은 청크 없음"""
+    assert TextChunker(chunk_size=30, chunk_overlap=5).split_text(text) == []
+
+
+def test_split_text_single_long_sentence():
+    """chunk_size보다 긴 단일 문장은 자르지 않고 하나의 청크로 유지"""
+    text = "가" * 100
+    
+    chunks = TextChunker(chunk_size=30, chunk_overlap=5).split_text(text)
+    
+    assert [chunk["content"] for chunk in chunks] == [text]
+
+
+def test_split_text_overlap():
+    """다음 청크는 이전 청크 끝의 chunk_overlap 문자를 포함해 시작"""
+    chunks = chunk_text(SENTENCES, chunk_size=30, chunk_overlap=5, metadata={"policy_id": 1})
+    
+    assert [chunk["content"] for chunk in chunks] == [
+        "첫 번째 문장입니다. 두 번째 문장입니다.",
+        "장입니다. 세 번째 문장입니다! 네 번째 문장인가요?"
+    ]
+    assert chunks[1]["content"].startswith(chunks[0]["content"][-5:])
+    assert [chunk["chunk_index"] for chunk in chunks] == [0, 1]
+    assert all(chunk["metadata"] == {"policy_id": 1} for chunk in chunks)
+
+
+def test_split_text_fits_in_one_chunk():
+    """chunk_size 이내의 텍스트는 하나의 청크"""
+    chunks = chunk_text(SENTENCES, chunk_size=500, chunk_overlap=50)
+    
+    assert [chunk["content"] for chunk in chunks] == [SENTENCES]
+
+
+def test_pack_chunks_empty():
+    """문장이 없으면 빈 경계 배열"""
+    empty = np.empty(0, dtype=np.int64)
+    
+    assert _pack_chunks(empty, empty, 30, 5).shape == (0, 2)
+
+
+def test_pack_chunks_fallback_matches_njit():
+    """numba JIT 경로와 순수 Python 경로의 결과가 동일"""
+    pytest.importorskip("numba")
+    rng = np.random.default_rng(0)
+    
+    for _ in range(50):
+        lengths = rng.integers(1, 80, size=rng.integers(1, 40))
+        ends = np.cumsum(lengths + 1).astype(np.int64)
+        starts = ends - lengths
+        
+        expected = _pack_chunks.py_func(starts, ends, 100, 20)
+        np.testing.assert_array_equal(_pack_chunks(starts, ends, 100, 20), expected)
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("  지원 대상  ", "지원 대상"),
+    ("지원 대상", "지원 대상"),
+    ("지원\n대상\t및   내용", "지원 대상 및 내용"),
+    ("지원\u00a0대상", "지원 대상"),
+    ("지원\r\n\r\n대상 ", "지원 대상")
+])
+def test_clean_text(text, expected):
+    """공백 문자열은 단일 공백으로 정규화 (fast path 포함)"""
+    assert TextChunker(chunk_size=30, chunk_overlap=5)._clean_text(text) == expected
@@ -0,0 +1,83 @@
+"""
+Embedding Cache Tests
+디스크 임베딩 캐시 테스트
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+from src.app.vector_store.embedding_cache import (
+    EmbeddingCache,
+    create_embedding_cache,
+    normalize_text
+)
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """임시 디렉토리의 임베딩 캐시"""
+    embedding_cache = EmbeddingCache(str(tmp_path), model_name="test-model", dimension=4)
+    yield embedding_cache
+    embedding_cache.close()
+
+
+def test_round_trip(cache):
+    """저장한 벡터를 float32, 같은 shape으로 조회 (float16 정밀도)"""
+    vector = np.array([0.1, -0.2, 0.3, 0.4], dtype=np.float32)
+    key = cache.make_key("창업 지원")
+    
+    cache.set_many({key: vector})
+    hits = cache.get_many([key])
+    
+    assert hits[key].dtype == np.float32
+    assert hits[key].shape == (4,)
+    np.testing.assert_allclose(hits[key], vector, atol=1e-3)
+
+
+def test_miss(cache):
+    """저장되지 않은 키와 차원이 다른 벡터는 미스"""
+    stored = cache.make_key("창업 지원")
+    wrong_dimension = cache.make_key("차원 불일치")
+    cache.set_many({
+        stored: np.zeros(4, dtype=np.float32),
+        wrong_dimension: np.zeros(3, dtype=np.float32)
+    })
+    
+    hits = cache.get_many([cache.make_key("고용 지원"), wrong_dimension])
+    
+    assert hits == {}
+
+
+def test_make_key_normalization(cache, tmp_path):
+    """대소문자/공백 차이는 같은 키, 구두점과 모델명 차이는 다른 키"""
+    assert cache.make_key("Startup  지원\n사업") == cache.make_key(" startup 지원 사업 ")
+    assert cache.make_key("금리 3.5%") != cache.make_key("금리 35")
+    assert normalize_text("금리 3.5%, 최대 1,000만원") == "금리 3.5%, 최대 1,000만원"
+    
+    other = EmbeddingCache(str(tmp_path), model_name="other-model", dimension=4)
+    try:
+        assert other.make_key("창업 지원") != cache.make_key("창업 지원")
+    finally:
+        other.close()
+
+
+def test_concurrent_access(cache):
+    """여러 스레드에서 동시에 저장/조회"""
+    def worker(i: int) -> bool:
+        key = cache.make_key(f"텍스트 {i}")
+        vector = np.full(4, i, dtype=np.float32)
+        cache.set_many({key: vector})
+        return np.array_equal(cache.get_many([key])[key], vector)
+    
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        assert all(executor.map(worker, range(64)))
+    
+    keys = [cache.make_key(f"텍스트 {i}") for i in range(64)]
+    assert len(cache.get_many(keys)) == 64
+
+
+def test_create_embedding_cache_disabled():
+    """캐시 디렉토리가 없으면 캐시 비활성화"""
+    assert create_embedding_cache(None, "test-model", 4) is None
@@ -0,0 +1,80 @@
+"""
+Ingestion Script Tests
+데이터 적재 스크립트 테스트
+"""
+
+import importlib.util
+from contextlib import contextmanager
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+
+INGEST_SCRIPT = Path(__file__).parent.parent / "scripts" / "ingest_data.py"
+
+
+@pytest.fixture(scope="module")
+def ingest_module():
+    """scripts/ingest_data.py 모듈 로드"""
+    spec = importlib.util.spec_from_file_location("ingest_data", INGEST_SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _make_document(module, doc_id: int, application_method):
+    """정책이 연결된 문서 객체 생성"""
+    policy = module.Policy(
+        id=doc_id,
+        program_id=1000 + doc_id,
+        program_name=f"테스트 정책 {doc_id}",
+        application_method=application_method
+    )
+    return SimpleNamespace(
+        id=doc_id,
+        policy_id=doc_id,
+        policy=policy,
+        content="창업 지원 프로그램입니다. 예비창업자를 지원합니다.",
+        doc_type=module.DocTypeEnum.OVERVIEW,
+        doc_metadata=None
+    )
+
+
+def test_ingest_to_qdrant_list_application_method(ingest_module):
+    """application_method가 리스트인 정책도 적재 (정책 페이로드만 생략)"""
+    documents = [
+        _make_document(ingest_module, 1, "온라인 신청"),
+        _make_document(ingest_module, 2, ["온라인 신청", "방문 접수"])
+    ]
+    
+    db = MagicMock()
+    db.query.return_value.options.return_value.all.return_value = documents
+    
+    @contextmanager
+    def fake_get_db():
+        yield db
+    
+    embedder = MagicMock(dimension=4)
+    embedder.embed_batch.side_effect = lambda texts, **kwargs: np.zeros((len(texts), 4), dtype=np.float32)
+    qdrant_manager = MagicMock()
+    
+    with patch.object(ingest_module, "get_db", fake_get_db), \
+         patch.object(ingest_module, "get_embedder", return_value=embedder), \
+         patch.object(ingest_module, "get_qdrant_manager", return_value=qdrant_manager):
+        total = ingest_module.ingest_to_qdrant()
+    
+    payloads = [
+        payload
+        for call in qdrant_manager.upsert_vectors.call_args_list
+        for payload in call.kwargs["payloads"]
+    ]
+    assert total == len(payloads) > 0
+    
+    payload_key = ingest_module.POLICY_PAYLOAD_KEY
+    valid = [p for p in payloads if p["policy_id"] == 1]
+    invalid = [p for p in payloads if p["policy_id"] == 2]
+    assert valid and all(p[payload_key]["application_method"] == "온라인 신청" for p in valid)
+    assert invalid and all(payload_key not in p for p in invalid)
@@ -0,0 +1,150 @@
+"""
+LLM Client Tests
+OpenAI 클라이언트 배치 응답 파싱 테스트
+"""
+
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.app.agent.nodes.eligibility_nodes import _generate_questions_batch, generate_question_node
+from src.app.domain.eligibility import ConditionQuestion
+from src.app.llm.openai_client import OpenAIClient
+
+
+ITEMS = [
+    {"condition_index": 0, "condition_name": "지역"},
+    {"condition_index": 2, "condition_name": "업력"}
+]
+
+
+def _client_returning(response: str) -> OpenAIClient:
+    """generate_with_system이 고정 응답을 반환하는 클라이언트 (ChatOpenAI 생성 생략)"""
+    client = OpenAIClient.__new__(OpenAIClient)
+    client.generate_with_system = MagicMock(return_value=response)
+    return client
+
+
+def test_generate_structured_batch_parses_markdown_json():
+    """마크다운 코드 블록으로 감싼 JSON 배열 파싱"""
+    response = "```json\n" + json.dumps([
+        {"condition_index": 0, "question": "지역을 알려주세요."},
+        {"condition_index": 2, "question": "업력을 알려주세요."}
+    ], ensure_ascii=False) + "\n```"
+    client = _client_returning(response)
+    
+    results = client.generate_structured_batch(
+        system_prompt="system",
+        items=ITEMS,
+        schema=ConditionQuestion
+    )
+    
+    assert results == [
+        {"condition_index": 0, "question": "지역을 알려주세요."},
+        {"condition_index": 2, "question": "업력을 알려주세요."}
+    ]
+
+
+@pytest.mark.parametrize("response", [
+    "질문을 생성할 수 없습니다.",
+    json.dumps([{"condition_index": 0, "question": "지역을 알려주세요."}]),
+    json.dumps([{"condition_index": 0}, {"condition_index": 2}]),
+    json.dumps({"condition_index": 0, "question": "지역을 알려주세요."})
+])
+def test_generate_structured_batch_rejects_invalid_response(response):
+    """JSON이 아니거나 길이/스키마가 맞지 않으면 ValueError"""
+    client = _client_returning(response)
+    
+    with pytest.raises(ValueError):
+        client.generate_structured_batch(
+            system_prompt="system",
+            items=ITEMS,
+            schema=ConditionQuestion
+        )
+
+
+def test_generate_questions_batch_maps_questions_to_indices():
+    """배치 결과를 조건 인덱스별 질문으로 변환 (요청하지 않은 인덱스 제외)"""
+    client = MagicMock()
+    client.generate_structured_batch.return_value = [
+        {"condition_index": 0, "question": " 지역을 알려주세요. "},
+        {"condition_index": 5, "question": "요청하지 않은 질문"}
+    ]
+    conditions = [{"name": "지역"}, {"name": "나이"}, {"name": "업력"}]
+    
+    with patch("src.app.agent.nodes.eligibility_nodes.get_openai_client", return_value=client):
+        questions = _generate_questions_batch("테스트 정책", conditions, [0, 2], {"age": "29"})
+    
+    assert questions == {0: "지역을 알려주세요."}
+    system_prompt = client.generate_structured_batch.call_args.kwargs["system_prompt"]
+    assert "테스트 정책" in system_prompt
+    assert "- age: 29" in system_prompt
+
+
+def test_generate_questions_batch_returns_empty_on_failure():
+    """배치 생성 실패 시 빈 dict 반환 (단일 질문 생성으로 폴백)"""
+    client = MagicMock()
+    client.generate_structured_batch.side_effect = ValueError("bad response")
+    
+    with patch("src.app.agent.nodes.eligibility_nodes.get_openai_client", return_value=client):
+        questions = _generate_questions_batch("테스트 정책", [{"name": "지역"}], [0], {})
+    
+    assert questions == {}
+
+
+def _question_state():
+    """UNKNOWN 조건 두 개가 남은 자격 확인 상태"""
+    return {
+        "policy_id": None,
+        "conditions": [
+            {"name": "지역", "type": "region", "status": "UNKNOWN"},
+            {"name": "나이", "type": "age", "status": "UNKNOWN"}
+        ],
+        "user_slots": {},
+        "current_condition_index": 0
+    }
+
+
+def test_generate_question_reuses_batch_questions():
+    """배치로 생성한 질문은 슬롯이 그대로면 다음 턴에 LLM 호출 없이 재사용"""
+    client = MagicMock()
+    client.generate_structured_batch.return_value = [
+        {"condition_index": 0, "question": "지역을 알려주세요."},
+        {"condition_index": 1, "question": "나이를 알려주세요."}
+    ]
+    
+    with patch("src.app.agent.nodes.eligibility_nodes.get_openai_client", return_value=client):
+        state = generate_question_node(_question_state())
+        assert state["current_question"] == "지역을 알려주세요."
+        
+        state["conditions"][0]["status"] = "PASS"
+        state["user_slots"]["region"] = "서울"
+        state["current_condition_index"] = 1
+        state = generate_question_node(state)
+    
+    assert state["current_question"] == "나이를 알려주세요."
+    assert client.generate_structured_batch.call_count == 1
+    client.generate.assert_not_called()
+    assert all("question" not in c for c in state["conditions"])
+
+
+def test_generate_question_regenerates_when_slot_changes():
+    """조건의 슬롯 값이 바뀌면 배치로 생성한 질문을 버리고 다시 생성"""
+    client = MagicMock()
+    client.generate_structured_batch.return_value = [
+        {"condition_index": 0, "question": "지역을 알려주세요."},
+        {"condition_index": 1, "question": "나이를 알려주세요."}
+    ]
+    client.generate.return_value = " 29세가 맞으신가요? "
+    
+    with patch("src.app.agent.nodes.eligibility_nodes.get_openai_client", return_value=client):
+        state = generate_question_node(_question_state())
+        
+        state["conditions"][0]["status"] = "PASS"
+        state["user_slots"].update({"region": "서울", "age": "29"})
+        state["current_condition_index"] = 1
+        state = generate_question_node(state)
+    
+    assert state["current_question"] == "29세가 맞으신가요?"
+    client.generate.assert_called_once()
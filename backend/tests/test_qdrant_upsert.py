@@ -0,0 +1,93 @@
+"""
+Qdrant Upsert Tests
+Qdrant 배치 업서트 테스트
+"""
+
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+from qdrant_client.models import Batch, PointStruct
+
+from src.app.vector_store import qdrant_client
+from src.app.vector_store.qdrant_client import QdrantManager
+
+
+BATCH_SIZE = qdrant_client._UPSERT_BATCH_SIZE
+
+
+@pytest.fixture
+def manager():
+    """QdrantClient를 모킹한 관리자"""
+    qdrant_manager = QdrantManager.__new__(QdrantManager)
+    qdrant_manager.client = MagicMock()
+    qdrant_manager.collection_name = "test_policies"
+    qdrant_manager.query_cache = MagicMock()
+    return qdrant_manager
+
+
+def _sent_chunks(manager):
+    """client.upsert에 전달된 (points, wait) 목록 (wait=False 청크는 병렬 전송되므로 ID 순 정렬)"""
+    chunks = [
+        (call.kwargs["points"], call.kwargs["wait"])
+        for call in manager.client.upsert.call_args_list
+    ]
+    return sorted(chunks, key=lambda chunk: (chunk[1], _first_id(chunk[0])))
+
+
+def _first_id(points):
+    """청크의 첫 포인트 ID"""
+    return points.ids[0] if isinstance(points, Batch) else points[0].id
+
+
+@pytest.mark.parametrize("count", [1, BATCH_SIZE, BATCH_SIZE + 1, 3 * BATCH_SIZE + 5])
+def test_upsert_vectors_batch_boundaries(manager, count):
+    """BATCH_SIZE 단위로 나눠 전송하고 마지막 배치만 wait=True"""
+    ids = list(range(count))
+    vectors = np.arange(count * 2, dtype=np.float64).reshape(count, 2)
+    payloads = [{"policy_id": i} for i in ids]
+    
+    assert manager.upsert_vectors(ids=ids, vectors=vectors, payloads=payloads)
+    
+    chunks = _sent_chunks(manager)
+    assert all(isinstance(points, Batch) for points, _ in chunks)
+    assert [len(points.ids) for points, _ in chunks] == [
+        min(BATCH_SIZE, count - start) for start in range(0, count, BATCH_SIZE)
+    ]
+    assert [wait for _, wait in chunks] == [False] * (len(chunks) - 1) + [True]
+    
+    # Every point is sent exactly once, with its own vector and payload
+    sent_ids = [i for points, _ in chunks for i in points.ids]
+    sent_vectors = [v for points, _ in chunks for v in points.vectors]
+    sent_payloads = [p for points, _ in chunks for p in points.payloads]
+    assert sent_ids == ids
+    assert sent_vectors == vectors.astype(np.float32).tolist()
+    assert sent_payloads == payloads
+    manager.query_cache.clear.assert_called_once()
+
+
+def test_upsert_vectors_empty(manager):
+    """업서트할 포인트가 없으면 전송하지 않음"""
+    assert manager.upsert_vectors(ids=[], vectors=np.empty((0, 2)), payloads=[]) is False
+    manager.client.upsert.assert_not_called()
+
+
+def test_upsert_points_generator(manager):
+    """제너레이터 입력도 BATCH_SIZE 단위 리스트로 전송"""
+    count = 2 * BATCH_SIZE + 1
+    points = (PointStruct(id=i, vector=[0.0, 1.0], payload={}) for i in range(count))
+    
+    assert manager.upsert_points(points)
+    
+    chunks = _sent_chunks(manager)
+    assert [len(points) for points, _ in chunks] == [BATCH_SIZE, BATCH_SIZE, 1]
+    assert [wait for _, wait in chunks] == [False, False, True]
+    assert [p.id for points, _ in chunks for p in points] == list(range(count))
+
+
+def test_upsert_chunked_propagates_errors(manager):
+    """전송 실패 시 예외 전파"""
+    manager.client.upsert.side_effect = RuntimeError("connection refused")
+    
+    with pytest.raises(RuntimeError):
+        manager.upsert_vectors(ids=[1, 2], vectors=np.zeros((2, 2)), payloads=[{}, {}])
@@ -0,0 +1,96 @@
+"""
+Query Cache Tests
+시맨틱 검색 결과 캐시 테스트
+"""
+
+from unittest.mock import patch
+
+import numpy as np
+
+from src.app.vector_store.query_cache import QueryCache
+
+
+RESULTS = [{"id": 1, "score": 0.9, "payload": {}}]
+
+
+def _vector(*values: float) -> np.ndarray:
+    """테스트용 float32 쿼리 벡터"""
+    return np.array(values, dtype=np.float32)
+
+
+def test_hit_above_threshold():
+    """임계값 이상으로 유사한 쿼리는 캐시 히트 (같은 검색 조건일 때만)"""
+    cache = QueryCache(dimension=2, similarity_threshold=0.99)
+    cache.put(_vector(1.0, 0.0), ("limit", 10), RESULTS)
+    
+    # cos ≈ 0.995, scale does not matter
+    assert cache.get(_vector(10.0, 1.0), ("limit", 10)) == RESULTS
+    assert cache.get(_vector(1.0, 0.0), ("limit", 5)) is None
+
+
+def test_results_are_copies():
+    """캐시에 저장/조회한 결과를 수정해도 캐시 항목은 변하지 않음"""
+    cache = QueryCache(dimension=2)
+    results = [{"id": 1, "score": 0.9, "payload": {"policy_id": 1}}]
+    cache.put(_vector(1.0, 0.0), "params", results)
+    
+    results[0]["score"] = 0.0
+    hit = cache.get(_vector(1.0, 0.0), "params")
+    hit[0]["payload"]["policy_id"] = 2
+    hit.reverse()
+    
+    assert cache.get(_vector(1.0, 0.0), "params") == [
+        {"id": 1, "score": 0.9, "payload": {"policy_id": 1}}
+    ]
+
+
+def test_miss_below_threshold():
+    """임계값 미만의 쿼리는 캐시 미스"""
+    cache = QueryCache(dimension=2, similarity_threshold=0.99)
+    cache.put(_vector(1.0, 0.0), "params", RESULTS)
+    
+    # cos ≈ 0.98
+    assert cache.get(_vector(5.0, 1.0), "params") is None
+    assert cache.get(_vector(0.0, 0.0), "params") is None
+    assert cache.get(_vector(1.0, 0.0, 0.0), "params") is None
+
+
+def test_ttl_expiry():
+    """TTL이 지난 항목은 반환하지 않고 슬롯을 반환"""
+    cache = QueryCache(dimension=2, max_entries=1, ttl=10.0)
+    
+    with patch("src.app.vector_store.query_cache.time.monotonic", return_value=100.0):
+        cache.put(_vector(1.0, 0.0), "params", RESULTS)
+    
+    with patch("src.app.vector_store.query_cache.time.monotonic", return_value=109.0):
+        assert cache.get(_vector(1.0, 0.0), "params") == RESULTS
+    
+    with patch("src.app.vector_store.query_cache.time.monotonic", return_value=110.0):
+        assert cache.get(_vector(1.0, 0.0), "params") is None
+    
+    assert cache._free_slots == [0]
+
+
+def test_lru_eviction_at_max_entries():
+    """가득 차면 가장 오래 사용하지 않은 항목을 제거"""
+    cache = QueryCache(dimension=2, max_entries=2)
+    first, second, third = _vector(1.0, 0.0), _vector(0.0, 1.0), _vector(-1.0, 0.0)
+    
+    cache.put(first, "params", [{"id": 1}])
+    cache.put(second, "params", [{"id": 2}])
+    cache.get(first, "params")
+    cache.put(third, "params", [{"id": 3}])
+    
+    assert cache.get(first, "params") == [{"id": 1}]
+    assert cache.get(second, "params") is None
+    assert cache.get(third, "params") == [{"id": 3}]
+
+
+def test_clear():
+    """clear 이후 모든 항목 미스"""
+    cache = QueryCache(dimension=2)
+    cache.put(_vector(1.0, 0.0), "params", RESULTS)
+    
+    cache.clear()
+    
+    assert cache.get(_vector(1.0, 0.0), "params") is None
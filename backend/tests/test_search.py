@@ -0,0 +1,180 @@
+"""
+Vector Search Tests
+MMR 및 정책 벡터 검색 후처리 테스트
+"""
+
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+from src.app.db.models import Policy
+from src.app.services import policy_search_service
+from src.app.services.policy_search_service import POLICY_PAYLOAD_KEY, PolicySearchService
+from src.app.vector_store.mmr import mmr_select
+
+
+def test_mmr_lambda_one_matches_relevance_order():
+    """lambda=1이면 스코어 내림차순과 동일"""
+    rng = np.random.default_rng(0)
+    scores = rng.random(10)
+    vectors = rng.normal(size=(10, 8))
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    
+    selected = mmr_select(scores, vectors, k=10, lambda_mult=1.0)
+    
+    assert selected == np.argsort(-scores).tolist()
+
+
+def test_mmr_demotes_duplicate_vectors():
+    """이미 선택된 결과와 같은 벡터는 뒤로 밀림"""
+    vectors = [[1.0, 0.0], [1.0, 0.0], [0.0, 1.0]]
+    scores = [0.9, 0.89, 0.7]
+    
+    assert mmr_select(scores, vectors, k=3, lambda_mult=0.5) == [0, 2, 1]
+    assert mmr_select(scores, vectors, k=2, lambda_mult=0.5) == [0, 2]
+
+
+@pytest.mark.parametrize("k", [0, -1])
+def test_mmr_empty_selection(k):
+    """k가 0 이하이면 빈 결과"""
+    assert mmr_select([0.9], [[1.0, 0.0]], k=k) == []
+
+
+def _make_service(hits, db_policies):
+    """Qdrant/임베딩/DB를 모킹한 검색 서비스"""
+    service = PolicySearchService.__new__(PolicySearchService)
+    service.embedder = MagicMock()
+    service.embedder.embed_query.return_value = np.zeros(4, dtype=np.float32)
+    service.qdrant_manager = MagicMock()
+    service.qdrant_manager.search.return_value = hits
+    service.db = MagicMock()
+    service.db.query.return_value.options.return_value.filter.return_value.all.return_value = db_policies
+    return service
+
+
+HITS = [
+    {
+        "id": "a",
+        "score": 0.9,
+        "payload": {
+            "policy_id": 1,
+            POLICY_PAYLOAD_KEY: {"id": 1, "program_id": 101, "program_name": "페이로드 정책"}
+        }
+    },
+    {"id": "b", "score": 0.88, "payload": {"policy_id": 2}},
+    {"id": "c", "score": 0.85, "payload": {"policy_id": 1}},
+    {"id": "d", "score": 0.8, "payload": {}},
+    {"id": "e", "score": 0.75, "payload": {"policy_id": 3}}
+]
+
+
+def test_vector_search_dedup_and_payload_short_circuit():
+    """정책별 최고 스코어만 남기고, 페이로드가 완전한 정책은 DB 조회 생략"""
+    db_policies = [
+        Policy(id=3, program_id=103, program_name="DB 정책 3"),
+        Policy(id=2, program_id=102, program_name="DB 정책 2")
+    ]
+    service = _make_service(HITS, db_policies)
+    
+    with patch.object(policy_search_service.settings, "policy_payload_complete", True), \
+         patch.object(policy_search_service.settings, "search_mmr_lambda", None):
+        responses = service._vector_search(
+            query="창업 지원",
+            region=None,
+            category=None,
+            limit=10,
+            offset=0,
+            score_threshold=0.5
+        )
+    
+    assert [(r.id, r.score, r.program_name) for r in responses] == [
+        (1, 0.9, "페이로드 정책"),
+        (2, 0.88, "DB 정책 2"),
+        (3, 0.75, "DB 정책 3")
+    ]
+    assert service.db.query.call_count == 1
+    assert service.qdrant_manager.search.call_args.kwargs["with_payload"] == ["policy_id", POLICY_PAYLOAD_KEY]
+
+
+def test_vector_search_offset_without_payload():
+    """페이로드를 사용하지 않으면 페이지의 정책을 모두 DB에서 조회"""
+    db_policies = [Policy(id=2, program_id=102, program_name="DB 정책 2")]
+    service = _make_service(HITS, db_policies)
+    
+    with patch.object(policy_search_service.settings, "policy_payload_complete", False), \
+         patch.object(policy_search_service.settings, "search_mmr_lambda", None):
+        responses = service._vector_search(
+            query="창업 지원",
+            region="서울",
+            category=None,
+            limit=1,
+            offset=1,
+            score_threshold=0.5
+        )
+    
+    assert [(r.id, r.score) for r in responses] == [(2, 0.88)]
+    search_kwargs = service.qdrant_manager.search.call_args.kwargs
+    assert search_kwargs["with_payload"] == ["policy_id"]
+    assert search_kwargs["filter_dict"] == {"region": "서울"}
+
+
+def test_vector_search_no_hits():
+    """검색 결과가 없으면 DB 조회 없이 빈 리스트"""
+    service = _make_service([], [])
+    
+    responses = service._vector_search(
+        query="창업 지원",
+        region=None,
+        category=None,
+        limit=10,
+        offset=0,
+        score_threshold=0.5
+    )
+    
+    assert responses == []
+    service.db.query.assert_not_called()
+
+
+def test_hybrid_search_web_fallback_uses_timeout():
+    """선행 실행 없이 시작한 웹 검색도 web_search_timeout까지만 대기"""
+    service = _make_service([], [])
+    release = threading.Event()
+    service._web_search = MagicMock(side_effect=lambda **kwargs: release.wait(5) and [])
+    
+    try:
+        with patch.object(policy_search_service.settings, "web_search_speculative", False), \
+             patch.object(policy_search_service.settings, "web_search_timeout", 0.05):
+            started = time.monotonic()
+            responses, total = service.hybrid_search(query="창업 지원", limit=5)
+            elapsed = time.monotonic() - started
+    finally:
+        release.set()
+    
+    assert (responses, total) == ([], 0)
+    assert elapsed < 1.0
+    service._web_search.assert_called_once_with(query="창업 지원", max_results=5)
+
+
+def test_hybrid_search_skips_web_search_when_db_results_suffice():
+    """DB 결과가 충분하고 선행 실행이 꺼져 있으면 웹 검색 호출 없음"""
+    db_policies = [
+        Policy(id=2, program_id=102, program_name="DB 정책 2"),
+        Policy(id=3, program_id=103, program_name="DB 정책 3")
+    ]
+    service = _make_service(HITS, db_policies)
+    service._web_search = MagicMock(return_value=[])
+    
+    with patch.object(policy_search_service.settings, "web_search_speculative", False), \
+         patch.object(policy_search_service.settings, "policy_payload_complete", True), \
+         patch.object(policy_search_service.settings, "search_mmr_lambda", None):
+        responses, total = service.hybrid_search(
+            query="창업 지원",
+            limit=10,
+            min_results_for_web_search=3
+        )
+    
+    assert total == 3
+    service._web_search.assert_not_called()
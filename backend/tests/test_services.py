@@ -26,7 +26,7 @@ def test_web_source_service_save(test_db):
             "url": "https://example.com",
             "title": "Test Source",
             "snippet": "Test snippet",
-            "source_type": "test"
+            "source_type": "tavily"
         }
     ]
     
@@ -51,7 +51,7 @@ def test_web_source_service_get(test_db):
             "url": "https://example.com",
             "title": "Test Source",
             "snippet": "Test snippet",
-            "source_type": "test"
+            "source_type": "tavily"
         }
     ]
     
@@ -68,6 +68,66 @@ def test_web_source_service_get(test_db):
     assert retrieved[0].url == "https://example.com"
 
 
+def test_web_source_service_save_bulk(test_db):
+    """WebSourceService 일괄 저장 테스트 (source_metadata 유지, 중복 URL 허용)"""
+    service = WebSourceService(test_db)
+    
+    sources = [
+        {
+            "url": "https://example.com/a",
+            "title": "Source A",
+            "snippet": "Snippet A",
+            "score": 0.9,
+            "source_type": "tavily"
+        },
+        {
+            "url": "https://example.com/a",
+            "title": "Source A (duplicate)",
+            "snippet": "Snippet A",
+            "score": 0.7,
+            "source_type": "tavily"
+        },
+        {
+            "url": "https://example.com/b",
+            "title": "Source B",
+            "source_type": "duckduckgo"
+        }
+    ]
+    
+    saved = service.save_web_sources(
+        session_id="test-session",
+        policy_id=1,
+        query="창업 지원",
+        sources=sources
+    )
+    
+    assert [source.url for source in saved] == [
+        "https://example.com/a",
+        "https://example.com/a",
+        "https://example.com/b"
+    ]
+    assert saved[0].source_metadata == {"query": "창업 지원", "score": 0.9}
+    
+    # Every row is inserted, duplicates included, with its own metadata
+    stored = test_db.query(WebSource).filter(WebSource.session_id == "test-session").all()
+    assert len(stored) == 3
+    assert sorted(source.source_metadata["score"] or 0.0 for source in stored) == [0.0, 0.7, 0.9]
+    assert all(source.source_metadata["query"] == "창업 지원" for source in stored)
+    assert all(source.created_at is not None for source in stored)
+
+
+def test_web_source_service_save_empty(test_db):
+    """빈 결과는 INSERT 없이 빈 리스트 반환"""
+    service = WebSourceService(test_db)
+    
+    assert service.save_web_sources(
+        session_id="test-session",
+        policy_id=1,
+        query="창업 지원",
+        sources=[]
+    ) == []
+
+
 @pytest.mark.skip(reason="Requires Qdrant connection")
 def test_policy_search_service_hybrid_search(test_db):
     """PolicySearchService 하이브리드 검색 테스트"""
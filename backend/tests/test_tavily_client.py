@@ -0,0 +1,100 @@
+"""
+Tavily Client Tests
+Tavily 검색 결과 캐시 테스트
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from src.app.web_search.clients.tavily_client import TavilySearchClient
+
+
+RESPONSE = {
+    "results": [
+        {
+            "title": "창업 지원 사업 공고",
+            "url": "https://example.com/notice",
+            "content": "예비창업자 지원",
+            "score": 0.9
+        }
+    ],
+    "answer": None
+}
+
+
+@pytest.fixture
+def tavily():
+    """TavilyClient.search를 모킹한 검색 클라이언트"""
+    with patch("src.app.web_search.clients.tavily_client.TavilyClient") as client_class:
+        client_class.return_value.search.return_value = RESPONSE
+        yield TavilySearchClient(api_key="tvly-test")
+
+
+def test_identical_search_skips_network(tavily):
+    """같은 검색은 두 번째 호출부터 캐시에서 반환"""
+    first = tavily.search("창업 지원", max_results=3)
+    second = tavily.search("창업 지원", max_results=3)
+    
+    assert first == second
+    assert first[0]["url"] == "https://example.com/notice"
+    assert tavily.client.search.call_count == 1
+
+
+def test_cached_results_are_copies(tavily):
+    """반환된 결과를 수정해도 캐시는 변하지 않음"""
+    tavily.search("창업 지원")[0]["title"] = "수정됨"
+    
+    assert tavily.search("창업 지원")[0]["title"] == "창업 지원 사업 공고"
+
+
+def test_different_kwargs_miss(tavily):
+    """검색 옵션이 다르면 캐시 미스"""
+    tavily.search("창업 지원", max_results=3)
+    tavily.search("창업 지원", max_results=5)
+    tavily.search("창업 지원", max_results=3, search_depth="basic")
+    tavily.search("창업 지원", max_results=3, include_domains=["go.kr"])
+    
+    assert tavily.client.search.call_count == 4
+
+
+def test_exception_is_not_cached(tavily):
+    """검색 실패는 캐시하지 않고 다음 호출에서 재시도"""
+    tavily.client.search.side_effect = [RuntimeError("timeout"), RESPONSE]
+    
+    assert tavily.search("창업 지원") == []
+    assert len(tavily.search("창업 지원")) == 1
+    assert tavily.client.search.call_count == 2
+
+
+def test_cache_info(tavily):
+    """cache_info가 히트/미스/크기를 보고"""
+    tavily.search("창업 지원")
+    tavily.search("창업 지원")
+    tavily.search("고용 지원")
+    
+    info = tavily.cache_info()
+    
+    assert info["hits"] == 1
+    assert info["misses"] == 2
+    assert info["size"] == 2
+    assert info["maxsize"] > 0
+    assert info["ttl"] > 0
+
+
+def test_search_many_keeps_query_order(tavily):
+    """search_many는 쿼리 순서대로 결과 반환"""
+    tavily.client.search.side_effect = lambda query, **kwargs: {
+        "results": [{"title": query, "url": f"https://example.com/{query}"}]
+    }
+    
+    results = tavily.search_many(["a", "b", "c"], max_results=1)
+    
+    assert [r[0]["title"] for r in results] == ["a", "b", "c"]
+    assert tavily.search_many([]) == []
+
+
+def test_search_without_api_key():
+    """API 키가 없으면 빈 결과"""
+    with patch("src.app.web_search.clients.tavily_client.settings.tavily_api_key", None):
+        assert TavilySearchClient().search("창업 지원") == []
@@ -34,10 +34,10 @@ CREATE TABLE IF NOT EXISTS policies (
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP COMMENT '생성일',
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP COMMENT '수정일',
     
-    INDEX idx_region (region),
-    INDEX idx_category (category),
-    INDEX idx_program_name (program_name),
-    INDEX idx_created_at (created_at)
+    INDEX idx_policies_region (region),
+    INDEX idx_policies_category (category),
+    INDEX idx_policies_program_name (program_name),
+    INDEX idx_policies_created_at (created_at)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='정책 메타 정보';
 
 -- ============================================================
@@ -53,8 +53,8 @@ CREATE TABLE IF NOT EXISTS documents (
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP COMMENT '생성일',
     
     FOREIGN KEY (policy_id) REFERENCES policies(id) ON DELETE CASCADE,
-    INDEX idx_policy_id (policy_id),
-    INDEX idx_doc_type (doc_type)
+    INDEX idx_documents_policy_id (policy_id),
+    INDEX idx_documents_doc_type (doc_type)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='정책 문서 (청킹용)';
 
 -- ============================================================
@@ -70,10 +70,10 @@ CREATE TABLE IF NOT EXISTS sessions (
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP COMMENT '수정일',
     
     FOREIGN KEY (policy_id) REFERENCES policies(id) ON DELETE SET NULL,
-    INDEX idx_user_id (user_id),
-    INDEX idx_policy_id (policy_id),
-    INDEX idx_workflow_type (workflow_type),
-    INDEX idx_created_at (created_at)
+    INDEX idx_sessions_user_id (user_id),
+    INDEX idx_sessions_policy_id (policy_id),
+    INDEX idx_sessions_workflow_type (workflow_type),
+    INDEX idx_sessions_created_at (created_at)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='멀티턴 세션 관리';
 
 -- ============================================================
@@ -87,8 +87,8 @@ CREATE TABLE IF NOT EXISTS slots (
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP COMMENT '생성일',
     
     FOREIGN KEY (session_id) REFERENCES sessions(id) ON DELETE CASCADE,
-    INDEX idx_session_id (session_id),
-    INDEX idx_slot_name (slot_name),
+    INDEX idx_slots_session_id (session_id),
+    INDEX idx_slots_slot_name (slot_name),
     UNIQUE KEY unique_session_slot (session_id, slot_name)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='사용자 입력 슬롯';
 
@@ -108,9 +108,9 @@ CREATE TABLE IF NOT EXISTS checklist_results (
     
     FOREIGN KEY (session_id) REFERENCES sessions(id) ON DELETE CASCADE,
     FOREIGN KEY (policy_id) REFERENCES policies(id) ON DELETE CASCADE,
-    INDEX idx_session_id (session_id),
-    INDEX idx_policy_id (policy_id),
-    INDEX idx_result (result)
+    INDEX idx_checklist_results_session_id (session_id),
+    INDEX idx_checklist_results_policy_id (policy_id),
+    INDEX idx_checklist_results_result (result)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='자격 확인 결과';
 
 -- ============================================================
@@ -131,9 +131,9 @@ CREATE TABLE IF NOT EXISTS web_sources (
     
     FOREIGN KEY (session_id) REFERENCES sessions(id) ON DELETE SET NULL,
     FOREIGN KEY (policy_id) REFERENCES policies(id) ON DELETE SET NULL,
-    INDEX idx_session_id (session_id),
-    INDEX idx_policy_id (policy_id),
-    INDEX idx_source_type (source_type)
+    INDEX idx_web_sources_session_id (session_id),
+    INDEX idx_web_sources_policy_id (policy_id),
+    INDEX idx_web_sources_source_type (source_type)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='웹검색 근거';
 
 -- ============================================================
@@ -148,9 +148,9 @@ CREATE TABLE IF NOT EXISTS chat_history (
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP COMMENT '생성일',
     
     FOREIGN KEY (session_id) REFERENCES sessions(id) ON DELETE CASCADE,
-    INDEX idx_session_id (session_id),
-    INDEX idx_role (role),
-    INDEX idx_created_at (created_at)
+    INDEX idx_chat_history_session_id (session_id),
+    INDEX idx_chat_history_role (role),
+    INDEX idx_chat_history_created_at (created_at)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='채팅 이력';
 
 -- ============================================================